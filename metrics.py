@@ -1,7 +1,14 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import List, Tuple, Optional
-from scipy.spatial.distance import euclidean
+from collections import OrderedDict
+from typing import List, Tuple, Optional, TYPE_CHECKING
+
+try:
+    import pygmo as pg
+except ImportError:
+    pg = None
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 class ParetoMetrics:
     """
@@ -10,8 +17,10 @@ class ParetoMetrics:
     - Hypervolume (HV): Measures dominated volume
     """
     
-    def __init__(self):
-        pass
+    def __init__(self, cache_size: int = 256):
+        # (front, reference point, utopian, nadir) -> (spread, hypervolume)
+        self._metric_cache: OrderedDict = OrderedDict()
+        self.cache_size = cache_size
     
     def spread_measure(self, pareto_front: np.ndarray, 
                       utopian: np.ndarray, 
@@ -37,25 +46,20 @@ class ParetoMetrics:
         sorted_front = pareto_front[np.argsort(pareto_front[:, 0])]
         
         # Calculate distances between consecutive solutions
-        distances = []
-        for i in range(len(sorted_front) - 1):
-            dist = euclidean(sorted_front[i], sorted_front[i + 1])
-            distances.append(dist)
+        diffs = sorted_front[1:] - sorted_front[:-1]
+        distances = np.sqrt(np.einsum('ij,ij->i', diffs, diffs))
         
-        if not distances:
-            return 0.0
-            
         # Mean distance between consecutive solutions
-        d_mean = np.mean(distances)
+        d_mean = distances.mean()
         
         # Distance from extreme solutions to utopian/nadir
         # d_f: distance from first solution to utopian
         # d_l: distance from last solution to nadir
-        d_f = euclidean(sorted_front[0], utopian)
-        d_l = euclidean(sorted_front[-1], nadir)
+        d_f = np.linalg.norm(sorted_front[0] - utopian)
+        d_l = np.linalg.norm(sorted_front[-1] - nadir)
         
         # Calculate spread measure
-        numerator = d_f + d_l + sum(abs(d - d_mean) for d in distances)
+        numerator = d_f + d_l + np.abs(distances - d_mean).sum()
         denominator = d_f + d_l + (len(distances)) * d_mean
         
         if denominator == 0:
@@ -101,50 +105,88 @@ class ParetoMetrics:
     def _hypervolume_2d(self, solutions: np.ndarray, 
                        reference_point: np.ndarray) -> float:
         """
-        Calculate 2D hypervolume using sweep line algorithm.
+        Calculate 2D hypervolume using a vectorized sweep line.
         """
         if len(solutions) == 0:
             return 0.0
             
         # Sort by first objective (ascending for minimization)
-        sorted_solutions = solutions[np.argsort(solutions[:, 0])]
+        sorted_solutions = solutions[np.argsort(solutions[:, 0], kind='stable')]
+        x = sorted_solutions[:, 0]
+        y = sorted_solutions[:, 1]
         
-        hypervolume = 0.0
-        prev_x = reference_point[0]
-        
-        for i, solution in enumerate(sorted_solutions):
-            x, y = solution
-            
-            # Add rectangular area
-            width = prev_x - x
-            height = reference_point[1] - y
-            
-            if width > 0 and height > 0:
-                hypervolume += width * height
-            
-            prev_x = x
-            
-            # Update reference point y-coordinate for next iteration
-            reference_point = np.array([reference_point[0], 
-                                      min(reference_point[1], y)])
+        # Each solution covers the strip up to the next one (or the reference
+        # point), at the best height reached so far along the sweep
+        widths = np.append(x[1:], reference_point[0]) - x
+        heights = reference_point[1] - np.minimum.accumulate(y)
         
-        return hypervolume
+        return float(np.sum(np.clip(widths, 0, None) * np.clip(heights, 0, None)))
     
     def _hypervolume_nd(self, solutions: np.ndarray, 
                        reference_point: np.ndarray) -> float:
         """
-        Calculate n-dimensional hypervolume using inclusion-exclusion.
-        Simplified implementation for demonstration.
+        Calculate exact n-dimensional hypervolume.
+        Uses pygmo's compiled implementation when available, otherwise
+        slices along the last objective down to the 2D sweep.
         """
         if len(solutions) == 0:
             return 0.0
-            
-        # For simplicity, use bounding box approach
-        # This is not the exact hypervolume but gives a reasonable approximation
-        min_vals = np.min(solutions, axis=0)
-        volume = np.prod(reference_point - min_vals)
         
-        return max(0.0, volume)
+        if pg is not None:
+            return float(pg.hypervolume(solutions).compute(reference_point))
+        
+        return self._hypervolume_slicing(solutions, reference_point)
+    
+    def _hypervolume_slicing(self, solutions: np.ndarray, 
+                            reference_point: np.ndarray) -> float:
+        """
+        Hypervolume by slicing objectives (HSO): sweep the last objective and
+        accumulate the (n-1)-dimensional volume of each slab.
+        """
+        if solutions.shape[1] == 2:
+            return self._hypervolume_2d(solutions, reference_point)
+        
+        sorted_solutions = solutions[np.argsort(solutions[:, -1], kind='stable')]
+        depths = np.append(sorted_solutions[1:, -1], reference_point[-1]) - sorted_solutions[:, -1]
+        
+        volume = 0.0
+        for i in np.flatnonzero(depths > 0):
+            volume += depths[i] * self._hypervolume_slicing(
+                sorted_solutions[:i + 1, :-1], reference_point[:-1])
+        
+        return volume
+    
+    def compute_both(self, pareto_front: np.ndarray,
+                     reference_point: np.ndarray,
+                     utopian: np.ndarray,
+                     nadir: np.ndarray) -> Tuple[float, float]:
+        """
+        Calculate Spread Measure and Hypervolume together, reusing the
+        result of a previous call for the same front.
+        
+        Archives change little between GVNS iterations, so the same front
+        is usually evaluated many times while tracking convergence.
+        
+        Returns:
+            Tuple[float, float]: (spread measure, hypervolume)
+        """
+        # Exact rows in order: duplicates and ties change the spread measure
+        key = (pareto_front.shape, pareto_front.dtype.str, pareto_front.tobytes(),
+               tuple(reference_point), tuple(utopian), tuple(nadir))
+        
+        cached = self._metric_cache.get(key)
+        if cached is not None:
+            self._metric_cache.move_to_end(key)
+            return cached
+        
+        result = (self.spread_measure(pareto_front, utopian, nadir),
+                  self.hypervolume(pareto_front, reference_point))
+        
+        self._metric_cache[key] = result
+        if len(self._metric_cache) > self.cache_size:
+            self._metric_cache.popitem(last=False)
+        
+        return result
     
     def calculate_nadir_from_utopian_factor(self, utopian: np.ndarray, 
                                           factor: float = 1.1) -> np.ndarray:
@@ -156,7 +198,7 @@ class ParetoMetrics:
     def plot_convergence(self, iterations: List[int], 
                         hv_values: List[float], 
                         delta_values: List[float],
-                        title: str = "Convergence of Quality Metrics") -> plt.Figure:
+                        title: str = "Convergence of Quality Metrics") -> "plt.Figure":
         """
         Plot convergence of both metrics over iterations.
         
@@ -169,6 +211,7 @@ class ParetoMetrics:
         Returns:
             matplotlib Figure object
         """
+        import matplotlib.pyplot as plt
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
         
         # Plot Hypervolume convergence
@@ -196,7 +239,7 @@ class ParetoMetrics:
     
     def plot_metrics_statistics(self, hv_data: List[List[float]], 
                                delta_data: List[List[float]],
-                               iterations: List[int]) -> plt.Figure:
+                               iterations: List[int]) -> "plt.Figure":
         """
         Plot metrics statistics (quantiles, median, mean) as shown in the paper.
         
@@ -208,6 +251,7 @@ class ParetoMetrics:
         Returns:
             matplotlib Figure object
         """
+        import matplotlib.pyplot as plt
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
         
         # Process hypervolume data
@@ -227,15 +271,16 @@ class ParetoMetrics:
     def _calculate_statistics(self, data: List[List[float]], 
                             iterations: List[int]) -> dict:
         """Calculate statistical measures for metric evolution."""
-        data_array = np.array(data)
+        data_array = np.asarray(data, dtype=float)
+        q25, median, q75 = np.percentile(data_array, [25, 50, 75], axis=0)
         
         return {
-            'mean': np.mean(data_array, axis=0),
-            'median': np.median(data_array, axis=0),
-            'q25': np.percentile(data_array, 25, axis=0),
-            'q75': np.percentile(data_array, 75, axis=0),
-            'min': np.min(data_array, axis=0),
-            'max': np.max(data_array, axis=0)
+            'mean': data_array.mean(axis=0),
+            'median': median,
+            'q25': q25,
+            'q75': q75,
+            'min': data_array.min(axis=0),
+            'max': data_array.max(axis=0)
         }
     
     def _plot_statistics(self, ax, iterations: List[int], stats: dict, 
@@ -261,6 +306,7 @@ class ParetoMetrics:
 # Example usage and testing
 def test_metrics():
     """Test the implemented metrics with sample data."""
+    import matplotlib.pyplot as plt
     
     # Create sample Pareto front (for minimization problem)
     np.random.seed(42)
@@ -25,18 +25,82 @@ tendo um conjunto não-dominado.
 19: fim enquanto
 20: retorne o arquivo A de soluções não-dominadas. """
 
+import os
 import random
-import copy
-from typing import List, Tuple, Optional
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional, TYPE_CHECKING
+import numpy as np
 from EVRP.solution import Solution
 from EVRP.metrics import EVRPMetrics
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+def _improve_with(local_search_algorithms, candidate: Solution, iterate = False) -> Solution:
+    method_idx = 0
+    while method_idx < len(local_search_algorithms):
+        method = local_search_algorithms[method_idx]
+        improved = method.local_search(candidate)
+        if improved and iterate:
+            method_idx = 0
+        else:
+            method_idx = method_idx + 1
+        
+    return candidate
+
+# Estado de cada processo do pool, preenchido uma única vez por _init_worker
+_worker_state = {}
+
+def _init_worker(local_search_algorithms, instance):
+    """
+    Inicializador do pool: os operadores e a instância (com as matrizes de
+    distância/tempo) são enviados uma vez por processo, e não a cada tarefa.
+    """
+    _worker_state['local_search_algorithms'] = local_search_algorithms
+    _worker_state['instance'] = instance
+
+def _pack_solution(solution: Solution) -> dict:
+    """Estado da solução sem a instância, para envio entre processos"""
+    state = dict(solution.__dict__)
+    del state['instance']
+    return state
+
+def _unpack_solution(state: dict, instance) -> Solution:
+    solution = Solution.__new__(Solution)
+    solution.__dict__.update(state)
+    solution.instance = instance
+    return solution
+
+def _local_search_task(state: dict, iterate: bool, seed: int) -> dict:
+    """
+    Uma busca local completa executada em um processo do pool.
+    A semente evita que processos criados por fork repitam a mesma sequência aleatória.
+    """
+    random.seed(seed)
+    candidate = _unpack_solution(state, _worker_state['instance'])
+    candidate = _improve_with(_worker_state['local_search_algorithms'], candidate, iterate)
+    candidate.evaluate()
+    return _pack_solution(candidate)
+
+def dominates_batch(a: np.ndarray, b: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Dominância de Pareto (minimização) entre populações de objetivos: matriz
+    (len(a), len(b)) em que [i, j] indica se a[i] domina b[j]. Sem b, compara
+    a consigo mesma
+    """
+    if b is None:
+        b = a
+    le = (a[:, None, :] <= b[None, :, :]).all(axis=-1)
+    lt = (a[:, None, :] < b[None, :, :]).any(axis=-1)
+    return le & lt
+
 class GVNS:
     def __init__(
         self, instance, 
         ns: int = 5, na: int = 50, ls_max_iter: int = 10,  max_evaluations: int = 10000, 
         perturbation = None, local_search = None, track_metrics: bool = True,
+        seed: Optional[int] = None, n_jobs: int = 1, verbose: int = 1,
+        adaptive_ns: bool = False,
     ):
         """
         Inicializa o algoritmo GVNS
@@ -50,6 +114,10 @@ class GVNS:
             perturbation: Lista de algoritmos de perturbação (se None, usa padrão)
             local_search: Lista de algoritmos de busca local (se None, usa padrão)
             track_metrics: Whether to track Pareto quality metrics during execution
+            seed: Semente do gerador aleatório usado na escolha de soluções do arquivo
+            n_jobs: Número de processos para as NS buscas locais (1 = sequencial)
+            verbose: Nível de log (0 = silencioso, 1 = resumo por iteração, 2 = cada busca local)
+            adaptive_ns: Reduz NS à metade enquanto o arquivo estiver estagnado
         """
         self.instance = instance
         self.ns = ns
@@ -59,6 +127,21 @@ class GVNS:
         self.evaluation_count = 0
         self.max_archive_not_changed = 5
         self.track_metrics = track_metrics
+        self._rng = np.random.default_rng(seed)
+        self.n_jobs = n_jobs
+        self.verbose = verbose
+        self.adaptive_ns = adaptive_ns
+        # Média móvel exponencial da taxa de iterações que alteraram o arquivo
+        self._success_ema = 0.5
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # Arquivo A em SoA: soluções e objetivos (N, 2); só entram soluções factíveis
+        self.archive_solutions: List[Solution] = []
+        self._archive_obj = np.empty((0, 2))
+        self.archive_objectives = self._archive_obj
+        self._archive_hashes = set()
+        # Quando True, o arquivo é uma fronteira não-dominada ordenada por distância
+        self._archive_is_front = True
         
         self.pertubation_algorithms = perturbation
         self.local_search_algorithms = local_search
@@ -69,77 +152,125 @@ class GVNS:
             self.archive_history = []
             self.metrics_iterations = []
 
-    def is_non_dominated(self, solution: Solution, archive: List[Solution]) -> bool:
+    def _non_dominated_mask(self, objectives: np.ndarray) -> np.ndarray:
         """
-        Verifica se uma solução é não-dominada em relação ao arquivo
+        Retorna a máscara das linhas não-dominadas de uma matriz (N, M) de
+        objetivos. Com dois objetivos usa o skyline de Kung em O(N log N);
+        caso contrário compara todos os pares de uma vez
         """
-        # Uma solução factível só pode ser dominada por outras soluções factíveis
-        for archived_sol in archive:
-            # Se a solução arquivada é factível e domina a solução atual
-            if archived_sol.is_feasible and archived_sol.dominates(solution):
-                return False
-        return True
+        if objectives.shape[1] == 2 and len(objectives) > 0:
+            # Linhas distintas em ordem lexicográfica (distância, custo): uma linha
+            # é não-dominada sse seu custo é menor que o de todas as anteriores
+            unique, inverse = np.unique(objectives, axis=0, return_inverse=True)
+            costs = unique[:, 1]
+            prev_min = np.minimum.accumulate(np.concatenate(([np.inf], costs[:-1])))
+            return (costs < prev_min)[inverse.reshape(-1)]
+
+        return ~dominates_batch(objectives).any(axis=0)
 
     # Alternative approach using hash-based duplicate detection
     def get_solution_hash(self, solution: Solution) -> tuple:
         """
         Retorna uma tupla hash da solução baseada nos objetivos
         Pode ser expandido para incluir mais detalhes se necessário
+        A tupla é montada uma única vez em Solution.evaluate()
+        """
+        return solution._obj_hash
+
+    def _append_to_archive(self, solution: Solution):
+        """
+        Insere uma solução no arquivo em SoA: a lista de soluções e o buffer
+        de objetivos, que dobra de tamanho quando fica cheio
         """
-        return (solution.total_distance, solution.total_cost)
+        n = len(self.archive_solutions)
+        if n == len(self._archive_obj):
+            capacity = max(2 * n, 1)
+            self._archive_obj = np.resize(self._archive_obj, (capacity, 2))
+
+        sol_hash = self.get_solution_hash(solution)
+        self._archive_obj[n] = sol_hash
+        self._archive_hashes.add(sol_hash)
+        self.archive_solutions.append(solution)
+
+        self.archive_objectives = self._archive_obj[:n + 1]
+
+    def _reset_archive(self, archive: List[Solution]):
+        """
+        Reconstrói os arrays do arquivo a partir de uma lista de soluções,
+        descartando as infactíveis e as duplicadas (mantém a primeira ocorrência)
+        """
+        self.archive_solutions = []
+        self._archive_hashes = set()
+        self.archive_objectives = self._archive_obj[:0]
+        for sol in archive:
+            if sol.is_feasible and self.get_solution_hash(sol) not in self._archive_hashes:
+                self._append_to_archive(sol)
+        # Uma lista externa não tem garantia de ser mutuamente não-dominada
+        self._archive_is_front = len(self.archive_solutions) == 0
 
     def update_archive(self, archive: List[Solution], new_solutions: List[Solution]) -> Tuple[List[Solution], bool]:
         """
         Versão mais eficiente usando hash para detectar duplicatas.
         Retorna (novo_arquivo, changed) onde changed indica se houve mudança.
+
+        O filtro de dominância e o truncamento operam só sobre os arrays de
+        objetivos; a lista retornada é a própria self.archive_solutions.
+        O conjunto de hashes do arquivo é mantido incrementalmente e, como as
+        soluções já arquivadas são mutuamente não-dominadas, só as novas são
+        comparadas entre si e contra o arquivo.
+        O arquivo é mantido ordenado por distância (e, numa fronteira, por custo
+        decrescente): as novas soluções entram por busca binária e o
+        truncamento em NA apenas descarta o final.
         """
-        # Cria set com hash das soluções existentes
-        existing_hashes = {self.get_solution_hash(sol) for sol in archive if sol.is_feasible}
-        old_hashes = {self.get_solution_hash(sol) for sol in archive if sol.is_feasible}
-        
-        # Filtra novas soluções
-        truly_new_solutions = []
-        for new_sol in new_solutions:
-            if new_sol.is_feasible:
-                new_hash = self.get_solution_hash(new_sol)
-                if new_hash not in existing_hashes:
-                    truly_new_solutions.append(new_sol)
-                    existing_hashes.add(new_hash)
+        if archive is not self.archive_solutions:
+            self._reset_archive(archive)
+
+        n_old = len(self.archive_solutions)
         
         # Adiciona novas soluções
-        archive.extend(truly_new_solutions)
+        for new_sol in new_solutions:
+            if new_sol.is_feasible and self.get_solution_hash(new_sol) not in self._archive_hashes:
+                self._append_to_archive(new_sol)
         
         # Remove soluções dominadas
-        non_dominated = []
-        processed_hashes = set()
-        
-        for sol in archive:
-            if not sol.is_feasible:
-                continue
-                
-            sol_hash = self.get_solution_hash(sol)
-            
-            # Evita processar soluções duplicadas
-            if sol_hash in processed_hashes:
-                continue
-                
-            if self.is_non_dominated(sol, archive):
-                non_dominated.append(sol)
-                print(sol_hash)
-                processed_hashes.add(sol_hash)
+        objectives = self.archive_objectives
+        # Entre não-dominadas distintas não há empate na distância, então a
+        # ordem por distância é total
+        if not self._archive_is_front:
+            keep = np.flatnonzero(self._non_dominated_mask(objectives))
+            keep = keep[np.argsort(objectives[keep, 0], kind='stable')]
+        elif len(objectives) == n_old:
+            keep = np.arange(n_old)
+        else:
+            old, new = objectives[:n_old], objectives[n_old:]
+            new_keep = self._non_dominated_mask(new) & ~dominates_batch(old, new).any(axis=0)
+            old_keep = np.flatnonzero(~dominates_batch(new[new_keep], old).any(axis=0))
+            new_keep = n_old + np.flatnonzero(new_keep)
+            new_keep = new_keep[np.argsort(objectives[new_keep, 0], kind='stable')]
+            # As sobreviventes antigas continuam ordenadas; as novas são intercaladas
+            positions = np.searchsorted(objectives[old_keep, 0], objectives[new_keep, 0])
+            keep = np.insert(old_keep, positions, new_keep)
+        self._archive_is_front = True
         
         # Apply size limit if necessary
-        if len(non_dominated) > self.na:
-            non_dominated.sort(key=lambda x: (x.total_distance, x.total_cost))
-            non_dominated = non_dominated[:self.na]
+        # Como o arquivo está ordenado, as NA menores distâncias são o início
+        keep = keep[:self.na]
 
-        # Detecta mudança
-        new_hashes = {self.get_solution_hash(sol) for sol in non_dominated if sol.is_feasible}
-        changed = new_hashes != old_hashes
+        # Detecta mudança: alguma nova solução entrou ou alguma antiga saiu
+        changed = bool((keep >= n_old).any()) or len(keep) != n_old
 
-        print(changed)
+        # Remove do conjunto os hashes das soluções descartadas
+        dropped = np.ones(len(objectives), dtype=bool)
+        dropped[keep] = False
+        self._archive_hashes.difference_update(map(tuple, objectives[dropped].tolist()))
 
-        return non_dominated, changed
+        # Compacta o buffer com as soluções sobreviventes
+        n = len(keep)
+        self.archive_solutions = [self.archive_solutions[i] for i in keep]
+        self._archive_obj[:n] = objectives[keep]
+        self.archive_objectives = self._archive_obj[:n]
+
+        return self.archive_solutions, changed
     
     def _track_metrics(self, archive: List[Solution], iteration: int):
         """
@@ -152,8 +283,15 @@ class GVNS:
         if not self.track_metrics:
             return
         
-        archive_copy = copy.deepcopy(archive)
-        self.archive_history.append(archive_copy)
+        # Para as métricas bastam os objetivos: guarda uma cópia (|A|, 2) em
+        # vez de clonar as soluções a cada iteração
+        if archive is self.archive_solutions:
+            # Cópia: o buffer do arquivo é reaproveitado nas próximas atualizações
+            objectives = self.archive_objectives.copy()
+        else:
+            objectives = self.metrics.solutions_to_pareto_front(
+                [sol for sol in archive if sol.is_feasible])
+        self.archive_history.append(objectives)
         self.metrics_iterations.append(iteration)
     
     def get_convergence_data(self) -> Optional[dict]:
@@ -168,7 +306,7 @@ class GVNS:
         
         return self.metrics.track_convergence(self.archive_history, self.metrics_iterations)
     
-    def plot_convergence(self, title: str = "EVRP GVNS Convergence") -> Optional[plt.Figure]:
+    def plot_convergence(self, title: str = "EVRP GVNS Convergence") -> Optional["plt.Figure"]:
         """
         Plot convergence of metrics during GVNS execution.
         
@@ -197,45 +335,103 @@ class GVNS:
         if not self.track_metrics or not self.archive_history:
             return None
         
-        final_archive = self.archive_history[-1]
-        return self.metrics.evaluate_solution_set(final_archive)
+        final_objectives = self.archive_history[-1]
+        return self.metrics.evaluate_objectives(final_objectives)
     
+    def _log(self, level: int, msg: str):
+        """Imprime msg apenas se o nível de verbosidade for suficiente"""
+        if self.verbose >= level:
+            print(msg)
+
     def _improve_solution(self, candidate: Solution, iterate = False) -> Solution:
-        method_idx = 0
-        while method_idx < len(self.local_search_algorithms):
-            method = self.local_search_algorithms[method_idx]
-            improved = method.local_search(candidate)
-            if improved and iterate:
-                method_idx = 0
-            else:
-                method_idx = method_idx + 1
-            
-        return candidate
+        return _improve_with(self.local_search_algorithms, candidate, iterate)
+
+    def _effective_ns(self) -> int:
+        """
+        NS usado no loop principal: com adaptive_ns, enquanto menos de 10% das
+        iterações recentes alteram o arquivo, cada busca gera metade das
+        soluções e o orçamento de avaliações rende mais perturbações
+        """
+        if self.adaptive_ns and self._success_ema < 0.1:
+            return min(self.ns, max(2, self.ns // 2))
+        return self.ns
+
+    def local_search(self, solution: Solution, iterate = False, ns: Optional[int] = None,
+                     in_place: bool = False) -> List[Solution]:
+        """
+        Gera até NS soluções por buscas locais independentes a partir de solution.
+        Com in_place=True o chamador abre mão de solution (ex.: a cópia devolvida
+        por perturbation) e a última busca a modifica diretamente, sem clonar.
+        """
+        if ns is None:
+            ns = self.ns
+        if self._executor is not None:
+            return self._parallel_local_search(solution, iterate, ns)
+
+        # Mesmas sementes por busca que o caminho paralelo: n_jobs só muda o tempo.
+        # O estado de random do processo principal é preservado, como quando as
+        # buscas rodam nos processos do pool
+        n_candidates = max(0, min(ns, self.max_evaluations - self.evaluation_count))
+        seeds = self._rng.integers(2**32, size=n_candidates).tolist()
+        main_random_state = random.getstate()
 
-    def local_search(self, solution: Solution, iterate = False) -> List[Solution]:
         solutions: List[Solution] = []
-        for _ in range(self.ns):
-            if self.evaluation_count >= self.max_evaluations:
-                break
-            candidate = copy.deepcopy(solution)
+        for k, seed in enumerate(seeds):
+            candidate = solution if in_place and k == ns - 1 else solution.clone()
             self.evaluation_count += 1
+            random.seed(seed)
             candidate = self._improve_solution(candidate, iterate)
             candidate.evaluate()
             if candidate.is_feasible:
                 solutions.append(candidate)
 
+        random.setstate(main_random_state)
+        return solutions
+    
+    def _parallel_local_search(self, solution: Solution, iterate: bool, ns: int) -> List[Solution]:
+        """Distribui as NS buscas locais independentes entre os processos do pool"""
+        n_candidates = max(0, min(ns, self.max_evaluations - self.evaluation_count))
+        seeds = self._rng.integers(2**32, size=n_candidates).tolist()
+        state = _pack_solution(solution)
+        futures = [
+            self._executor.submit(_local_search_task, state, iterate, seed)
+            for seed in seeds
+        ]
+        self.evaluation_count += n_candidates
+
+        solutions: List[Solution] = []
+        for future in futures:
+            candidate = _unpack_solution(future.result(), self.instance)
+            if candidate.is_feasible:
+                solutions.append(candidate)
+
         return solutions
     
     def perturbation(self, solution: Solution) -> Solution:
-        perturbed_sol = copy.deepcopy(solution)
+        perturbed_sol = solution.clone()
+        
+        # Cópia intacta do estado acumulado que não pertence a perturbed_sol:
+        # enquanto existir, desfazer um operador no lugar custa só um clone na falha
+        pristine = solution
         
         # Reavalia a solução perturbada
         for method in self.pertubation_algorithms:
+            # Operadores que alteram a solução no lugar (o padrão) precisam de
+            # um backup do estado acumulado; os que devolvem uma cópia própria
+            # (perturbs_in_place = False) não pagam por ele
+            in_place = getattr(method, 'perturbs_in_place', True)
+            backup = perturbed_sol.clone() if in_place and pristine is None else None
             new_solution = method.perturbation(perturbed_sol)
             new_solution.evaluate()
             self.evaluation_count += 1
             if new_solution.is_feasible:
-                perturbed_sol = copy.deepcopy(new_solution)
+                # Já é uma cópia própria (a mesma modificada no lugar ou uma nova)
+                perturbed_sol = new_solution
+                pristine = None
+            elif in_place:
+                # Perturbação aplicada no lugar gerou solução infactível: volta
+                # ao estado anterior a ela, mantendo as perturbações já aceitas
+                perturbed_sol = backup if backup is not None else pristine.clone()
         
         return perturbed_sol
     
@@ -249,18 +445,32 @@ class GVNS:
         Returns:
             Lista de soluções não-dominadas
         """
-        print("Iniciando algoritmo GVNS...")
+        if self.n_jobs > 1:
+            self._executor = ProcessPoolExecutor(
+                max_workers=min(self.n_jobs, os.cpu_count() or 1),
+                initializer=_init_worker,
+                initargs=(self.local_search_algorithms, self.instance),
+            )
+        try:
+            return self._run(initial_population)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _run(self, initial_population: List[Solution]) -> List[Solution]:
+        self._log(1, "Iniciando algoritmo GVNS...")
         
         # Passo 7-8: Inicializa arquivo A vazio e processa população inicial
         archive = []
         
-        print(f"Processando população inicial de {len(initial_population)} soluções...")
+        self._log(1, f"Processando população inicial de {len(initial_population)} soluções...")
         for i, solution in enumerate(initial_population):
-            print(f"Processando solução {i+1}/{len(initial_population)}")
+            self._log(2, f"Processando solução {i+1}/{len(initial_population)}")
             
             # Só processa soluções factíveis
             if not solution.is_feasible:
-                print(f"  Solução {i+1} não é factível, pulando...")
+                self._log(2, f"  Solução {i+1} não é factível, pulando...")
                 continue
             
             # Passo 9: Aplica busca local NS vezes
@@ -269,43 +479,40 @@ class GVNS:
             # Passo 10: Atualiza arquivo A
             archive, _ = self.update_archive(archive, local_solutions)
             
-            print(f"  Soluções geradas: {len(local_solutions)}, Arquivo A: {len(archive)}")
+            self._log(2, f"  Soluções geradas: {len(local_solutions)}, Arquivo A: {len(archive)}")
             
             # Verifica limite de avaliações
             if self.evaluation_count >= self.max_evaluations:
-                print("Limite de avaliações atingido na população inicial")
+                self._log(1, "Limite de avaliações atingido na população inicial")
                 break
         
-        print(f"Arquivo A inicial criado com {len(archive)} soluções")
+        self._log(1, f"Arquivo A inicial criado com {len(archive)} soluções")
         
         # Track initial metrics
         self._track_metrics(archive, 0)
         
         # Verifica se o arquivo inicial tem soluções factíveis
         if len(archive) == 0:
-            print("❌ Nenhuma solução factível encontrada na população inicial!")
-            print("Verifique se as soluções iniciais são factíveis.")
+            self._log(1, "❌ Nenhuma solução factível encontrada na população inicial!")
+            self._log(1, "Verifique se as soluções iniciais são factíveis.")
             return []
         
         # Passo 12-19: Loop principal do GVNS
         iteration = 0
+        self._success_ema = 0.5
 
         while self.evaluation_count < self.max_evaluations:
             iteration += 1
-            print(f"\nIteração {iteration} - Avaliações: {self.evaluation_count}/{self.max_evaluations}")
+            self._log(1, f"\nIteração {iteration} - Avaliações: {self.evaluation_count}/{self.max_evaluations}")
             
             if len(archive) == 0:
-                print("Arquivo A vazio, parando algoritmo")
+                self._log(1, "Arquivo A vazio, parando algoritmo")
                 break
             
             # Passo 13: Escolhe solução aleatória do arquivo A
-            # Filtra apenas soluções factíveis para escolha
-            feasible_solutions = [sol for sol in archive if sol.is_feasible]
-            if not feasible_solutions:
-                print("  ❌ Nenhuma solução factível no arquivo, parando algoritmo")
-                break
-                
-            x = random.choice(feasible_solutions)
+            # update_archive só admite soluções factíveis, então qualquer
+            # posição do arquivo serve e não é preciso filtrar a cada iteração
+            x = archive[self._rng.integers(len(archive))]
             
             # Passo 14: Loop de busca local
             ls_iter = 0
@@ -316,13 +523,13 @@ class GVNS:
                    self.evaluation_count < self.max_evaluations):
                 
                 ls_iter += 1
-                print(f"  Tentativa de busca local {ls_iter}/{self.ls_max_iter}")
+                self._log(2, f"  Tentativa de busca local {ls_iter}/{self.ls_max_iter}")
                 
                 # Passo 15: Aplica perturbação
                 x_prime = self.perturbation(x)
                 
                 # Passo 16: Aplica busca local NS vezes
-                local_solutions = self.local_search(x_prime, True)
+                local_solutions = self.local_search(x_prime, True, self._effective_ns(), in_place=True)
                 
                 # Passo 17: Atualiza arquivo A
                 old_size = len(archive)
@@ -331,17 +538,18 @@ class GVNS:
                 
                 if changed:
                     archive_changed = True
-                    print(f"    Arquivo A atualizado: {old_size} -> {new_size}")
+                    self._log(2, f"    Arquivo A atualizado: {old_size} -> {new_size}")
                 
-                print(f"    Soluções geradas: {len(local_solutions)}, Avaliações: {self.evaluation_count}")
+                self._log(2, f"    Soluções geradas: {len(local_solutions)}, Avaliações: {self.evaluation_count}")
             
             if not archive_changed:
-                print(f"  Nenhuma melhoria encontrada em {ls_iter} tentativas")
+                self._log(1, f"  Nenhuma melhoria encontrada em {ls_iter} tentativas")
+            self._success_ema = 0.9 * self._success_ema + 0.1 * archive_changed
             
             self._track_metrics(archive, iteration)
             
             if self.evaluation_count >= self.max_evaluations:
-                print("Limite de avaliações atingido no loop principal")
+                self._log(1, "Limite de avaliações atingido no loop principal")
                 break
 
         final_solutions = [solution for solution in archive]
@@ -351,17 +559,17 @@ class GVNS:
             local_solutions = self.local_search(solution, True)
             archive, changed = self.update_archive(archive, local_solutions)
 
-        print(f"\nAlgoritmo GVNS finalizado!")
-        print(f"Total de iterações: {iteration}")
-        print(f"Total de avaliações: {self.evaluation_count}")
-        print(f"Soluções não-dominadas encontradas: {len(archive)}")
+        self._log(1, f"\nAlgoritmo GVNS finalizado!")
+        self._log(1, f"Total de iterações: {iteration}")
+        self._log(1, f"Total de avaliações: {self.evaluation_count}")
+        self._log(1, f"Soluções não-dominadas encontradas: {len(archive)}")
         
         if self.track_metrics:
             final_metrics = self.get_final_metrics()
             if final_metrics:
-                print(f"\n📊 Métricas Finais:")
-                print(f"  Spread Measure (Δ): {final_metrics['spread_measure']:.4f}")
-                print(f"  Hypervolume (HV): {final_metrics['hypervolume']:.4f}")
-                print(f"  Soluções factíveis: {final_metrics['num_feasible']}/{final_metrics['num_solutions']}")
+                self._log(1, f"\n📊 Métricas Finais:")
+                self._log(1, f"  Spread Measure (Δ): {final_metrics['spread_measure']:.4f}")
+                self._log(1, f"  Hypervolume (HV): {final_metrics['hypervolume']:.4f}")
+                self._log(1, f"  Soluções factíveis: {final_metrics['num_feasible']}/{final_metrics['num_solutions']}")
         
         return archive
\ No newline at end of file
@@ -3,4 +3,4 @@ from .create_instance import *
 from .constructive_heuristic import *
 from .solution import *
 from .metrics import *
-from .GVNS import GVNS
+from .GVNS import GVNS, dominates_batch
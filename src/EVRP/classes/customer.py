@@ -1,6 +1,8 @@
 from .node import Node, NodeType
 
 class Customer(Node):
+    __slots__ = ('demand', 'service_time', 'ready_time', 'due_date')
+
     def __init__(self, 
             id: int,
             x: float,
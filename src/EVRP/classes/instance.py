@@ -1,12 +1,14 @@
-from typing import Dict, List, TypeAlias
+from typing import Dict, FrozenSet, List, Optional, Set, TypeAlias
+import numpy as np
 from EVRP.classes.customer import Customer
 from EVRP.classes.depot import Depot
-from EVRP.classes.node import Node
+from EVRP.classes.node import Node, NodeType
 from EVRP.classes.station import Station
 from EVRP.classes.technology import Technology
 from EVRP.classes.vehicle import Vehicle
 
-Matrix: TypeAlias = Dict[int, Dict[int, float]]
+# Matriz (max_id + 1, max_id + 1) indexada diretamente pelo id dos nós: m[from_id, to_id]
+Matrix: TypeAlias = np.ndarray
 
 class Instance:
     def __init__(self):
@@ -22,9 +24,75 @@ class Instance:
         self.max_route_duration = 0
         self.charging_fixed_time = 0
         self.battery_depreciation_cost = 0
+        # Índices montados sob demanda: id -> nó, ids dos clientes e ids das
+        # tecnologias de recarga disponíveis em cada depósito/estação
+        self._nodes_by_id: Dict[int, Node] = {}
+        self._customer_ids: Set[int] = set()
+        self._technology_ids: Dict[int, FrozenSet[int]] = {}
+        self._num_indexed_nodes = 0
+        self._energy_matrix: Optional[Matrix] = None
+        self._demands: Optional[np.ndarray] = None
+        self._service_times: Optional[np.ndarray] = None
 
-    def get_node_by_id(self, id: int):
+    def _index_new_nodes(self):
+        # Os nós são adicionados diretamente em self.nodes, então os índices são
+        # completados com os que entraram desde a última consulta; com ids
+        # repetidos vale o primeiro nó, como na busca linear
+        if self._num_indexed_nodes < len(self.nodes):
+            for node in self.nodes[self._num_indexed_nodes:]:
+                self._nodes_by_id.setdefault(node.id, node)
+                if node.type == NodeType.CUSTOMER:
+                    self._customer_ids.add(node.id)
+                else:
+                    self._technology_ids.setdefault(node.id, frozenset(t.id for t in node.technologies))
+            self._num_indexed_nodes = len(self.nodes)
+
+    def get_energy_matrix(self) -> Matrix:
+        """
+        Energia gasta em cada arco (distance_matrix * consumption_rate),
+        calculada na primeira consulta; a matriz de distâncias e o veículo
+        não devem mudar depois disso
+        """
+        if self._energy_matrix is None:
+            self._energy_matrix = self.distance_matrix * self.vehicle.consumption_rate
+        return self._energy_matrix
+
+    def _build_customer_arrays(self):
+        # Vetores indexados pelo id do nó; depósitos, estações e ids sem nó valem 0
+        size = max((node.id for node in self.nodes), default=-1) + 1
+        self._demands = np.zeros(size)
+        self._service_times = np.zeros(size)
         for node in self.nodes:
-            if node.id == id:
-                return node
-        return None
+            if node.type == NodeType.CUSTOMER:
+                self._demands[node.id] = node.demand
+                self._service_times[node.id] = node.service_time
+
+    def get_demands(self) -> np.ndarray:
+        """Demanda de cada nó, indexada pelo id (calculada na primeira consulta)"""
+        if self._demands is None:
+            self._build_customer_arrays()
+        return self._demands
+
+    def get_service_times(self) -> np.ndarray:
+        """Tempo de serviço de cada nó, indexado pelo id (calculado na primeira consulta)"""
+        if self._service_times is None:
+            self._build_customer_arrays()
+        return self._service_times
+
+    def get_node_by_id(self, id: int) -> Optional[Node]:
+        self._index_new_nodes()
+        return self._nodes_by_id.get(id)
+
+    def get_customer_ids(self) -> Set[int]:
+        """Ids de todos os clientes (não modificar o conjunto retornado)"""
+        self._index_new_nodes()
+        return self._customer_ids
+
+    def get_technology_ids(self) -> Dict[int, FrozenSet[int]]:
+        """
+        Ids das tecnologias disponíveis por id de depósito/estação. As
+        tecnologias de cada nó são lidas na primeira consulta após o nó entrar
+        em self.nodes (não modificar o dicionário retornado)
+        """
+        self._index_new_nodes()
+        return self._technology_ids
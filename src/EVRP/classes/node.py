@@ -6,8 +6,14 @@ class NodeType(Enum):
     STATION = 3
 
 class Node:
+    __slots__ = ('id', 'type', 'x', 'y')
+
     def __init__(self, id: int, node_type: NodeType, x: float, y: float):
         self.id = id
         self.type = node_type
         self.x = x
-        self.y = y
\ No newline at end of file
+        self.y = y
+
+    # Nós são dados imutáveis da instância: copy.deepcopy pode compartilhá-los
+    def __deepcopy__(self, memo):
+        return self
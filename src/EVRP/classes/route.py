@@ -1,10 +1,14 @@
 from typing import List, Dict, Tuple
+import numpy as np
 
 from EVRP.classes.instance import Instance
 from EVRP.classes.node import Node, NodeType
 from EVRP.classes.technology import Technology
 
 class Route:
+    __slots__ = ('nodes', 'charging_decisions', 'total_distance', 'total_cost', 'total_time', 'is_feasible',
+                 'current_battery', 'current_load', 'current_time')
+
     def __init__(self):
         self.nodes: List[Node] = []
         self.charging_decisions: Dict[int, Tuple[Technology, float]] = {}
@@ -12,6 +16,10 @@ class Route:
         self.total_cost: float = 0
         self.total_time: float = 0
         self.is_feasible: bool = True
+        # Estado do veículo durante a construção da rota (heurística construtiva)
+        self.current_battery: float = 0
+        self.current_load: float = 0
+        self.current_time: float = 0
 
     def evaluate(self, instance: Instance):
         if not self.nodes:
@@ -23,70 +31,112 @@ class Route:
         self.total_time = 0
         self.is_feasible = True
         
-        current_battery = instance.vehicle.battery_capacity
+        capacity = instance.vehicle.capacity
+        battery_capacity = instance.vehicle.battery_capacity
+        charging_fixed_time = instance.charging_fixed_time
+        battery_depreciation_cost = instance.battery_depreciation_cost
+        charging_decisions = self.charging_decisions
+        technology_ids = instance.get_technology_ids()
+        CUSTOMER = NodeType.CUSTOMER
+
+        current_battery = battery_capacity
         current_load = 0
         current_time = 0
+        total_distance = 0
+        total_cost = 0
         
         # First and last nodes must be depots
         if not self.nodes or self.nodes[0].type != NodeType.DEPOT or self.nodes[-1].type != NodeType.DEPOT:
             self.is_feasible = False
             return
 
-        start_depot_id = self.nodes[0].id
+        # item() devolve float nativo, mais barato que um escalar NumPy no laço
+        distance_at = instance.distance_matrix.item
+        time_at = instance.time_matrix.item
+        energy_at = instance.get_energy_matrix().item
 
-        prev_node_id = start_depot_id
+        prev_node_id = self.nodes[0].id
         
         for i, node in enumerate(self.nodes[1:], 1):
             node_id = node.id
             
-            travel_dist = instance.distance_matrix[prev_node_id][node_id]
-            travel_time = instance.time_matrix[prev_node_id][node_id]
-            energy_consumed = travel_dist * instance.vehicle.consumption_rate
+            travel_dist = distance_at(prev_node_id, node_id)
+            travel_time = time_at(prev_node_id, node_id)
+            energy_consumed = energy_at(prev_node_id, node_id)
             
             if current_battery < energy_consumed:
+                self.total_distance = total_distance
+                self.total_cost = total_cost
                 self.is_feasible = False
                 #print(f"Route, Node {i}: Insufficient battery: {current_battery:.2f} < {energy_consumed:.2f}")
                 return
             
             current_battery -= energy_consumed
             current_time += travel_time
-            self.total_distance += travel_dist
+            total_distance += travel_dist
             
-            if node.type == NodeType.CUSTOMER:
+            if node.type is CUSTOMER:
                 current_load += node.demand
                 current_time += node.service_time
                 
-                if current_load > instance.vehicle.capacity:
+                if current_load > capacity:
+                    self.total_distance = total_distance
+                    self.total_cost = total_cost
                     self.is_feasible = False
                     #print(f"Route, Node {i}: Capacity exceeded: {current_load:.2f} > {instance.vehicle.capacity:.2f}")
                     return
             else:
-                if node_id in self.charging_decisions:
-                    tech, energy_to_charge = self.charging_decisions[node_id]
-                    
-                    tech_found = any(t.id == tech.id for t in node.technologies)
+                if node_id in charging_decisions:
+                    tech, energy_to_charge = charging_decisions[node_id]
                     
-                    if not tech_found:
+                    if tech.id not in technology_ids.get(node_id, ()):
+                        self.total_distance = total_distance
+                        self.total_cost = total_cost
                         self.is_feasible = False
                         #print(f"Route, Node {i}: Technology {tech.id} not available at node {node_id}")
                         return
                     
                     charging_time = energy_to_charge / tech.power
-                    current_time += instance.charging_fixed_time + charging_time
-                    current_battery = min(current_battery + energy_to_charge, instance.vehicle.battery_capacity)
+                    current_time += charging_fixed_time + charging_time
+                    current_battery = min(current_battery + energy_to_charge, battery_capacity)
                     
-                    self.total_cost += energy_to_charge * tech.cost_per_kwh
-                    if hasattr(instance, 'battery_depreciation_cost'):
-                        self.total_cost += instance.battery_depreciation_cost
+                    total_cost += energy_to_charge * tech.cost_per_kwh
+                    total_cost += battery_depreciation_cost
             
             prev_node_id = node_id
         
+        self.total_distance = total_distance
+        self.total_cost = total_cost
         self.total_time = current_time
         
         if current_time > instance.max_route_duration:
             self.is_feasible = False
             #print(f"Route: Time limit exceeded: {current_time:.2f} > {instance.max_route_duration:.2f}")
     
+    def node_ids(self) -> np.ndarray:
+        """
+        Ids dos nós da rota como array, para indexar as matrizes da instância
+        de uma vez em vez de nó a nó
+        """
+        return np.fromiter((node.id for node in self.nodes), dtype=np.intp, count=len(self.nodes))
+
+    def clone(self) -> "Route":
+        """
+        Cópia rasa da rota: os nós (imutáveis) são compartilhados, apenas a
+        lista de nós e o dicionário de recargas são duplicados.
+        """
+        new_route = Route.__new__(Route)
+        new_route.nodes = list(self.nodes)
+        new_route.charging_decisions = dict(self.charging_decisions)
+        new_route.total_distance = self.total_distance
+        new_route.total_cost = self.total_cost
+        new_route.total_time = self.total_time
+        new_route.is_feasible = self.is_feasible
+        new_route.current_battery = self.current_battery
+        new_route.current_load = self.current_load
+        new_route.current_time = self.current_time
+        return new_route
+
     def dominates(self, new_route: "Route") -> bool:
         """
         Verifica se sol1 domina sol2 (critério de dominância de Pareto)
@@ -94,11 +144,11 @@ class Route:
         # Para o EVRP, consideramos múltiplos objetivos
         # Objetivo 1: Minimizar distância total
         # Objetivo 2: Minimizar custo total
-        # Verifica se sol1 é melhor ou igual em todos os objetivos
-        if (self.total_distance <= new_route.total_distance and
-            self.total_cost <= new_route.total_cost):
-            # Verifica se sol1 é melhor em pelo menos um objetivo
-            if (self.total_distance < new_route.total_distance or
-                self.total_cost < new_route.total_cost):
-                return True
-        return False
\ No newline at end of file
+        # Falha rápido: qualquer objetivo pior já descarta a dominância
+        if self.total_distance > new_route.total_distance:
+            return False
+        if self.total_cost > new_route.total_cost:
+            return False
+        # Melhor ou igual em todos: domina se for melhor em pelo menos um
+        return (self.total_distance < new_route.total_distance or
+                self.total_cost < new_route.total_cost)
\ No newline at end of file
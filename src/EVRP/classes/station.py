@@ -3,6 +3,8 @@ from EVRP.classes.node import Node, NodeType
 from EVRP.classes.technology import Technology
 
 class Station(Node):
+    __slots__ = ('technologies',)
+
     def __init__(
             self, 
             id: int,
@@ -1,6 +1,8 @@
 TECH_NAME = ["S", "M", "F"]
 
 class Technology:
+    __slots__ = ('id', 'power', 'cost_per_kwh')
+
     def __init__(self, id: int, power: float, cost_per_kwh: float):
         self.id = id
         self.power = power  # kWh/h
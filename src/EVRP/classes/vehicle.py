@@ -1,4 +1,6 @@
 class Vehicle:
+    __slots__ = ('capacity', 'battery_capacity', 'consumption_rate', 'max_range')
+
     def __init__(self, capacity: float, battery_capacity: float, consumption_rate: float):
         self.capacity = capacity  # kg
         self.battery_capacity = battery_capacity  # kWh
@@ -1,8 +1,9 @@
 import random
+import numpy as np
 from typing import Dict, List, Tuple, Optional
 from EVRP.classes.customer import Customer
 from EVRP.classes.instance import Instance
-from EVRP.classes.node import NodeType
+from EVRP.classes.node import Node
 from EVRP.classes.route import Route
 from EVRP.classes.station import Station
 from EVRP.classes.depot import Depot
@@ -17,168 +18,175 @@ class ConstructiveHeuristic:
         self.closest_customers_cache = {}
         self.closest_stations_cache = {}
         
-        self.customers = {}
-        self.stations = {}
-        self.depots = {}
+        # The instance already keeps its nodes partitioned by type
+        self.customers = {customer.id: customer for customer in instance.customers}
+        self.stations = {station.id: station for station in instance.stations}
+        self.depots = {depot.id: depot for depot in instance.depots}
         
-        for node in instance.nodes:
-            if node.type == NodeType.CUSTOMER:
-                self.customers[node.id] = node
-            elif node.type == NodeType.STATION:
-                self.stations[node.id] = node
-            elif node.type == NodeType.DEPOT:
-                self.depots[node.id] = node
+        # Depots with technologies are also valid recharge locations
+        self.recharge_locations = list(self.stations.values())
+        self.recharge_locations.extend(depot for depot in self.depots.values() if depot.technologies)
+        # Technologies offered at each recharge location (a depot wins over a station with the same id)
+        self.recharge_technologies = {node.id: node.technologies for node in self.recharge_locations}
+        self.closest_recharge_cache = {}
+        self.closest_depot_cache = {}
+        # Best recharge option by exact (from_id, battery, load, time) state, per construction
+        self.recharge_option_cache = {}
+        # Energy per arc, read directly instead of multiplying distance by consumption rate
+        self.energy_matrix = instance.get_energy_matrix()
+        # Demand and service time by node id (zero for depots and stations), as lists for fast scalar reads
+        self.demands = instance.get_demands().tolist()
+        self.service_times = instance.get_service_times().tolist()
         
     def _precompute_closest_lists(self):
-        all_node_ids = [node.id for node in self.instance.nodes]
+        """Sort customers and stations by distance from every node, once per instance"""
+        if self.closest_customers_cache:
+            return
+        
+        all_node_ids = np.array([node.id for node in self.instance.nodes])
         
-        for node_id in all_node_ids:
-            customer_distances = []
-            for cust_id, customer in self.customers.items():
-                if cust_id != node_id:
-                    dist = self.instance.distance_matrix[node_id][cust_id]
-                    customer_distances.append((dist, customer))
-            customer_distances.sort(key=lambda x: x[0])
-            self.closest_customers_cache[node_id] = [customer for _, customer in customer_distances]
+        for cache, nodes_by_id in ((self.closest_customers_cache, self.customers),
+                                   (self.closest_stations_cache, self.stations)):
+            candidates = list(nodes_by_id.values())
+            candidate_ids = np.array(list(nodes_by_id.keys()), dtype=all_node_ids.dtype)
+            # Stable sort keeps ties in instance order
+            order = np.argsort(self.instance.distance_matrix[np.ix_(all_node_ids, candidate_ids)],
+                               axis=1, kind='stable')
             
-            station_distances = []
-            for station_id, station in self.stations.items():
-                if station_id != node_id:
-                    dist = self.instance.distance_matrix[node_id][station_id]
-                    station_distances.append((dist, station))
-            station_distances.sort(key=lambda x: x[0])
-            self.closest_stations_cache[node_id] = [station for _, station in station_distances]
+            candidate_id_list = candidate_ids.tolist()
+            for node_id, row in zip(all_node_ids.tolist(), order.tolist()):
+                cache[node_id] = [candidates[k] for k in row if candidate_id_list[k] != node_id]
     
     def _can_reach_directly(self, from_id: int, to_id: int, current_battery: float, 
                            current_load: float, current_time: float) -> bool:
         """Check if we can reach destination directly without violating any constraint"""
-        # Check capacity constraint if destination is customer
-        additional_demand = 0
-        service_time = 0
+        instance = self.instance
         
-        if to_id in self.customers:
-            additional_demand = self.customers[to_id].demand
-            service_time = self.customers[to_id].service_time
-            
-            if current_load + additional_demand > self.instance.vehicle.capacity:
-                return False
+        # Check capacity constraint (depots and stations have no demand)
+        if current_load + self.demands[to_id] > instance.vehicle.capacity:
+            return False
         
         # Check battery constraint
-        distance = self.instance.distance_matrix[from_id][to_id]
-        energy_needed = distance * self.instance.vehicle.consumption_rate
+        energy_needed = self.energy_matrix[from_id, to_id]
         if current_battery < energy_needed:
             return False
             
         # Check time constraint
-        travel_time = self.instance.time_matrix[from_id][to_id]
-        new_time = current_time + travel_time + service_time
+        travel_time = instance.time_matrix[from_id, to_id]
+        new_time = current_time + travel_time + self.service_times[to_id]
         
-        if new_time > self.instance.max_route_duration:
+        if new_time > instance.max_route_duration:
             return False
             
         return True
     
-    def _can_reach_depot_via_station(self, from_id: int, station_id: int, current_battery: float, 
-                                   current_load: float, current_time: float, target_depot_id: int) -> bool:
-        """Check if we can reach depot via a specific recharge station"""
-        # Check if we can reach the station
-        if not self._can_reach_directly(from_id, station_id, current_battery, current_load, current_time):
-            return False
-            
-        # Calculate state at station (after travel)
-        dist_to_station = self.instance.distance_matrix[from_id][station_id]
-        energy_to_station = dist_to_station * self.instance.vehicle.consumption_rate
-        time_to_station = self.instance.time_matrix[from_id][station_id]
-        
-        battery_at_station = current_battery - energy_to_station
-        time_at_station = current_time + time_to_station
+    def _closest_recharge_locations(self, from_id: int) -> Tuple[List[Node], List[float], List[float]]:
+        """
+        Recharge locations sorted by distance from from_id (closest first), with
+        the energy and travel time needed to reach each one, gathered from the
+        matrices in one go. Only depends on from_id, so it is computed once per node.
+        """
+        cached = self.closest_recharge_cache.get(from_id)
+        if cached is None:
+            distances = self.instance.distance_matrix[from_id]
+            locations = sorted(self.recharge_locations, key=lambda node: distances[node.id])
+            ids = np.array([node.id for node in locations], dtype=np.intp)
+            energy = self.energy_matrix[from_id, ids]
+            cached = (locations, energy.tolist(), self.instance.time_matrix[from_id, ids].tolist())
+            self.closest_recharge_cache[from_id] = cached
+        return cached
+    
+    def _reachable_recharge_locations(self, from_id: int, current_battery: float,
+                                      current_time: float) -> List[Tuple[Node, float, float]]:
+        """
+        Recharge locations that can be reached directly (battery and time), closest
+        first, with the energy and travel time to each one. This is the first check of
+        the recharge search, done here on plain floats for all locations so the others
+        are never tried.
+        """
+        closest_recharge, energy_to_stations, time_to_stations = self._closest_recharge_locations(from_id)
+        max_route_duration = self.instance.max_route_duration
+        return [
+            (station, energy, travel_time)
+            for station, energy, travel_time in zip(closest_recharge, energy_to_stations, time_to_stations)
+            if not current_battery < energy and not current_time + travel_time > max_route_duration
+        ]
+    
+    def _find_best_recharge_station_to_depot(self, from_id: int, current_battery: float, 
+                                           current_load: float, current_time: float, target_depot_id: int,
+                                           candidates: Optional[List[Tuple[Node, float, float]]] = None
+                                           ) -> Optional[Tuple[Station, Technology, float]]:
+        """
+        Find the best recharge station to reach depot from current position.
+        candidates: result of _reachable_recharge_locations for the same state,
+        when the caller already has it (e.g. when trying every depot)
+        """
+        # Depots add no load, so a state over capacity cannot reach any of them
+        if current_load > self.instance.vehicle.capacity:
+            return None
+        if candidates is None:
+            candidates = self._reachable_recharge_locations(from_id, current_battery, current_time)
         
-        # Get available technologies at station
-        if station_id in self.depots and self.depots[station_id].technologies:
-            available_techs = self.depots[station_id].technologies
-        elif station_id in self.stations:
-            available_techs = self.stations[station_id].technologies
-        else:
-            return False
+        # Loop invariants
+        energy_matrix = self.energy_matrix
+        time_matrix = self.instance.time_matrix
+        battery_capacity = self.instance.vehicle.battery_capacity
+        max_route_duration = self.instance.max_route_duration
+        charging_fixed_time = self.instance.charging_fixed_time
+        capacity = self.instance.vehicle.capacity
+        demands = self.demands
+        service_times = self.service_times
         
-        if not available_techs:
-            return False
+        for station, energy_to_station, time_to_station in candidates:
+            station_id = station.id
             
-        # Try each technology to see if any allows reaching depot
-        for tech in available_techs:
-            # Calculate maximum feasible recharge considering time constraint
-            max_time_for_recharge = self.instance.max_route_duration - time_at_station - self.instance.charging_fixed_time
-            if max_time_for_recharge <= 0:
+            # Quirk kept on purpose for identical output: in the *_21 data station and
+            # customer ids collide, and the baseline applied the customer's demand and
+            # service time at the station. Not a rule to rely on
+            if current_load + demands[station_id] > capacity:
                 continue
-                
-            max_energy_by_time = max_time_for_recharge * tech.power
-            max_energy_by_capacity = self.instance.vehicle.battery_capacity - battery_at_station
             
-            energy_to_recharge = min(max_energy_by_time, max_energy_by_capacity)
-            if energy_to_recharge <= 0:
+            # State at station (after travel), shared by the reachability check and the search
+            battery_at_station = current_battery - energy_to_station
+            time_at_station = current_time + time_to_station
+            if time_at_station + service_times[station_id] > max_route_duration:
                 continue
-                
-            battery_after_recharge = battery_at_station + energy_to_recharge
-            recharge_time = energy_to_recharge / tech.power
-            time_after_recharge = time_at_station + self.instance.charging_fixed_time + recharge_time
             
-            # Check if we can reach depot with this recharge
-            if self._can_reach_directly(station_id, target_depot_id, battery_after_recharge, 
-                                      current_load, time_after_recharge):
-                return True
-                
-        return False
-    
-    def _find_best_recharge_station_to_depot(self, from_id: int, current_battery: float, 
-                                           current_load: float, current_time: float, target_depot_id: int) -> Optional[Tuple[Station, Technology, float]]:
-        """Find the best recharge station to reach depot from current position"""
-        recharge_locations = list(self.stations.values())
-        # Depots with technologies are also valid recharge locations
-        for depot in self.depots.values():
-            if depot.technologies:
-                recharge_locations.append(depot)
-            
-        # Sort by distance from current position (closest first)
-        recharge_distances = []
-        for node in recharge_locations:
-            dist = self.instance.distance_matrix[from_id][node.id]
-            recharge_distances.append((dist, node))
-        recharge_distances.sort(key=lambda x: x[0])
-        
-        for _, station in recharge_distances:
-            if not self._can_reach_depot_via_station(from_id, station.id, current_battery, current_load, current_time, target_depot_id):
+            # Calculate maximum feasible recharge (same for every technology)
+            max_time_for_recharge = max_route_duration - time_at_station - charging_fixed_time
+            if max_time_for_recharge <= 0:
                 continue
-                
-            # Calculate optimal recharge at this station
-            dist_to_station = self.instance.distance_matrix[from_id][station.id]
-            energy_to_station = dist_to_station * self.instance.vehicle.consumption_rate
-            time_to_station = self.instance.time_matrix[from_id][station.id]
+            max_energy_by_capacity = battery_capacity - battery_at_station
             
-            battery_at_station = current_battery - energy_to_station
-            time_at_station = current_time + time_to_station
+            energy_to_depot = energy_matrix[station_id, target_depot_id]
+            time_to_depot = time_matrix[station_id, target_depot_id]
             
-            # Get available technologies
-            if station.id in self.depots:
-                available_techs = self.depots[station.id].technologies
+            available_techs = self.recharge_technologies[station_id]
+            
+            # The station is only usable if recharging as much as possible with some
+            # technology lets the vehicle reach the depot
+            for tech in available_techs:
+                energy_to_recharge = min(max_time_for_recharge * tech.power, max_energy_by_capacity)
+                if energy_to_recharge <= 0:
+                    continue
+                
+                battery_after_recharge = battery_at_station + energy_to_recharge
+                time_after_recharge = time_at_station + charging_fixed_time + energy_to_recharge / tech.power
+                if (not battery_after_recharge < energy_to_depot
+                        and not time_after_recharge + time_to_depot > max_route_duration):
+                    break
             else:
-                available_techs = self.stations[station.id].technologies
+                continue
+            
+            # Find minimum energy needed to reach depot
+            min_energy_needed = max(0, energy_to_depot - battery_at_station)
             
             # Find best technology and recharge amount
             best_option = None
             min_cost = float('inf')
             
             for tech in available_techs:
-                # Calculate maximum feasible recharge
-                max_time_for_recharge = self.instance.max_route_duration - time_at_station - self.instance.charging_fixed_time
-                if max_time_for_recharge <= 0:
-                    continue
-                    
                 max_energy_by_time = max_time_for_recharge * tech.power
-                max_energy_by_capacity = self.instance.vehicle.battery_capacity - battery_at_station
-                
-                # Find minimum energy needed to reach depot
-                energy_to_depot = self.instance.distance_matrix[station.id][target_depot_id] * self.instance.vehicle.consumption_rate
-                min_energy_needed = max(0, energy_to_depot - battery_at_station)
                 
                 # Recharge amount should be at least minimum needed, but not exceed limits
                 energy_to_recharge = min(max_energy_by_time, max_energy_by_capacity)
@@ -186,42 +194,74 @@ class ConstructiveHeuristic:
                 
                 if energy_to_recharge < min_energy_needed:
                     continue
+                
+                # A technology that cannot beat the best option so far is not worth checking
+                cost = energy_to_recharge * tech.cost_per_kwh
+                if cost >= min_cost:
+                    continue
                     
                 recharge_time = energy_to_recharge / tech.power
-                time_after_recharge = time_at_station + self.instance.charging_fixed_time + recharge_time
+                time_after_recharge = time_at_station + charging_fixed_time + recharge_time
                 battery_after_recharge = battery_at_station + energy_to_recharge
                 
                 # Verify we can reach depot
-                if self._can_reach_directly(station.id, target_depot_id, battery_after_recharge, 
-                                          current_load, time_after_recharge):
-                    cost = energy_to_recharge * tech.cost_per_kwh
-                    if cost < min_cost:
-                        min_cost = cost
-                        best_option = (station, tech, energy_to_recharge)
+                if (not battery_after_recharge < energy_to_depot
+                        and not time_after_recharge + time_to_depot > max_route_duration):
+                    min_cost = cost
+                    best_option = (station, tech, energy_to_recharge)
             
             if best_option:
                 return best_option
                 
         return None
 
+    def _closest_depots(self, from_id: int) -> List[Tuple[int, float, float]]:
+        """
+        (depot id, energy, travel time) from from_id to every depot, closest first
+        (ties keep the depot order). Only depends on from_id, so it is computed once per node.
+        """
+        cached = self.closest_depot_cache.get(from_id)
+        if cached is None:
+            depot_ids = list(self.depots.keys())
+            distances = self.instance.distance_matrix[from_id, depot_ids]
+            order = np.argsort(distances, kind='stable').tolist()
+            energy = self.energy_matrix[from_id, depot_ids].tolist()
+            times = self.instance.time_matrix[from_id, depot_ids].tolist()
+            cached = [(depot_ids[k], energy[k], times[k]) for k in order]
+            self.closest_depot_cache[from_id] = cached
+        return cached
+
     def _can_reach_any_depot_directly(self, from_id: int, current_battery: float, 
                                       current_load: float, current_time: float) -> Optional[int]:
-        best_depot_id = None
-        best_dist = float('inf')
-        for depot in self.depots.values():
-            if self._can_reach_directly(from_id, depot.id, current_battery, current_load, current_time):
-                dist = self.instance.distance_matrix[from_id][depot.id]
-                if dist < best_dist:
-                    best_dist = dist
-                    best_depot_id = depot.id
-        return best_depot_id
+        """Closest depot reachable directly from from_id, or None"""
+        # Depots add no load, so the capacity check does not depend on the depot
+        if current_load > self.instance.vehicle.capacity:
+            return None
+        max_route_duration = self.instance.max_route_duration
+        # The first reachable depot in distance order is the closest reachable one
+        for depot_id, energy_needed, travel_time in self._closest_depots(from_id):
+            if current_battery < energy_needed:
+                continue
+            if current_time + travel_time > max_route_duration:
+                continue
+            return depot_id
+        return None
 
     def _find_best_recharge_station_to_any_depot(self, from_id: int, current_battery: float, 
                                                  current_load: float, current_time: float) -> Optional[Tuple[Station, Technology, float, int]]:
+        # The answer only depends on the state, which repeats across scans and builds
+        # (e.g. the first customers of routes leaving the same depot)
+        key = (from_id, current_battery, current_load, current_time)
+        if key in self.recharge_option_cache:
+            return self.recharge_option_cache[key]
+        
         best_option = None
         min_cost = float('inf')
+        # The reachable stations do not depend on the target depot
+        candidates = self._reachable_recharge_locations(from_id, current_battery, current_time)
         for depot in self.depots.values():
-            option = self._find_best_recharge_station_to_depot(from_id, current_battery, current_load, current_time, depot.id)
+            option = self._find_best_recharge_station_to_depot(from_id, current_battery, current_load, current_time,
+                                                              depot.id, candidates)
             if option is None:
                 continue
             station, tech, energy = option
@@ -229,79 +269,111 @@ class ConstructiveHeuristic:
             if cost < min_cost:
                 min_cost = cost
                 best_option = (station, tech, energy, depot.id)
+        self.recharge_option_cache[key] = best_option
         return best_option
     
-    def _get_k_closest_feasible_customers(self, current_pos: int, visited: set, route: Route) -> List[Customer]:
-        """Get up to k closest unvisited customers that are reachable according to capacity, autonomy and time"""
+    def _get_k_closest_feasible_customers(self, current_pos: int, visited: set, route: Route
+                                          ) -> List[Tuple[Customer, float, float, float, Optional[Tuple[Station, Technology, float, int]]]]:
+        """
+        Get up to k closest unvisited customers that are reachable according to capacity, autonomy and time.
+        Each entry is (customer, battery, load, time) after visiting the customer, plus the recharge option
+        needed to reach a depot from there (None when a depot can be reached directly).
+        """
         feasible_customers = []
         
-        if current_pos not in self.closest_customers_cache:
+        closest_customers = self.closest_customers_cache.get(current_pos)
+        if closest_customers is None:
             return []
+        
+        # The route state does not change during the scan
+        current_battery = route.current_battery
+        current_load = route.current_load
+        current_time = route.current_time
+        energy_matrix = self.energy_matrix
+        time_matrix = self.instance.time_matrix
+        k = self.k
+        # The load only grows along the route, so customers whose demand no longer fits are
+        # discarded before the full reachability check
+        capacity = self.instance.vehicle.capacity
+        max_route_duration = self.instance.max_route_duration
             
-        for customer in self.closest_customers_cache[current_pos]:
+        for customer in closest_customers:
             if customer in visited:
                 continue
-                
-            # Check if customer is reachable and we can still reach depot (directly or via station)
-            if not self._can_reach_directly(current_pos, customer.id, route.current_battery, 
-                                          route.current_load, route.current_time):
+            if current_load + customer.demand > capacity:
                 continue
+            customer_id = customer.id
             
-            # Calculate state after visiting customer
-            distance_to_customer = self.instance.distance_matrix[current_pos][customer.id]
-            energy_consumed = distance_to_customer * self.instance.vehicle.consumption_rate
-            travel_time = self.instance.time_matrix[current_pos][customer.id]
+            # Check if customer is reachable (the checks of _can_reach_directly, inline). The list
+            # is sorted by distance and energy grows with it, so once the battery is not enough
+            # for one customer it is not enough for any of the following ones
+            energy_consumed = energy_matrix[current_pos, customer_id]
+            if current_battery < energy_consumed:
+                break
+            travel_time = time_matrix[current_pos, customer_id]
+            time_after_customer = current_time + travel_time + customer.service_time
+            if time_after_customer > max_route_duration:
+                continue
             
-            battery_after_customer = route.current_battery - energy_consumed
-            load_after_customer = route.current_load + customer.demand
-            time_after_customer = route.current_time + travel_time + customer.service_time
+            # Calculate state after visiting customer
+            battery_after_customer = current_battery - energy_consumed
+            load_after_customer = current_load + customer.demand
             
             # Check if we can reach any depot directly or via station after visiting customer
-            can_reach_depot = (
-                self._can_reach_any_depot_directly(
-                    customer.id,
-                    battery_after_customer,
-                    load_after_customer,
-                    time_after_customer,
-                ) is not None
-                or self._find_best_recharge_station_to_any_depot(
-                    customer.id,
+            recharge_option = None
+            if self._can_reach_any_depot_directly(customer_id, battery_after_customer,
+                                                  load_after_customer, time_after_customer) is None:
+                recharge_option = self._find_best_recharge_station_to_any_depot(
+                    customer_id,
                     battery_after_customer,
                     load_after_customer,
                     time_after_customer,
-                ) is not None
-            )
+                )
+                if recharge_option is None:
+                    continue
             
-            if can_reach_depot:
-                feasible_customers.append(customer)
-                if len(feasible_customers) >= self.k:
-                    break
+            feasible_customers.append((customer, battery_after_customer, load_after_customer,
+                                       time_after_customer, recharge_option))
+            if len(feasible_customers) >= k:
+                break
                     
         return feasible_customers
     
     def build_initial_solution(self) -> Solution:
         """k-PseudoGreedy Algorithm with guaranteed feasibility"""
         self._precompute_closest_lists()
+        # Recharge options are keyed by exact float states, which rarely repeat
+        # across constructions; start each one with an empty cache
+        self.recharge_option_cache.clear()
+        
+        instance = self.instance
+        distance_matrix = instance.distance_matrix
+        time_matrix = instance.time_matrix
+        energy_matrix = self.energy_matrix
+        battery_capacity = instance.vehicle.battery_capacity
+        charging_fixed_time = instance.charging_fixed_time
+        num_customers = len(self.customers)
+        choice = random.choice
         
-        solution = Solution(self.instance)
+        solution = Solution(instance)
         visited_customers = set()
         
         # Step 1: Initialize solution by setting h := 1 and i := 0
         h = 1  # route number
         
         # Step 13: until all customers are served
-        while len(visited_customers) < len(self.customers):
+        while len(visited_customers) < num_customers:
             # Initialize new route h
             route = Route()
             # Choose a home depot for this route: nearest depot to the closest unvisited customer
-            if len(visited_customers) < len(self.customers):
+            if len(visited_customers) < num_customers:
                 remaining_customers = [c for c in self.customers.values() if c not in visited_customers]
                 # pick the globally closest customer to any depot
                 best_pair = None
                 best_dist = float('inf')
                 for depot in self.depots.values():
                     for cust in remaining_customers:
-                        d = self.instance.distance_matrix[depot.id][cust.id]
+                        d = distance_matrix[depot.id, cust.id]
                         if d < best_dist:
                             best_dist = d
                             best_pair = (depot, cust)
@@ -310,12 +382,12 @@ class ConstructiveHeuristic:
                 home_depot = next(iter(self.depots.values()))
 
             route.nodes = [home_depot]
-            route.current_battery = self.instance.vehicle.battery_capacity
+            route.current_battery = battery_capacity
             route.current_load = 0.0
             route.current_time = 0.0
             i = home_depot.id  # start from selected depot
 
-            route.charging_decisions[home_depot.id] = (self.instance.technologies[0], route.current_battery)
+            route.charging_decisions[home_depot.id] = (instance.technologies[0], route.current_battery)
             
             # Step 2: repeat
             while True:
@@ -325,67 +397,54 @@ class ConstructiveHeuristic:
                 if not feasible_customers:
                     break  # No more feasible customers for this route
                     
-                j = random.choice(feasible_customers)  # select customer j at random
-                
-                # Add customer j to route and update route state
-                distance_to_customer = self.instance.distance_matrix[i][j.id]
-                energy_consumed = distance_to_customer * self.instance.vehicle.consumption_rate
-                travel_time = self.instance.time_matrix[i][j.id]
+                # select customer j at random; the state after visiting it was computed by the scan
+                j, route.current_battery, route.current_load, route.current_time, recharge_option = \
+                    choice(feasible_customers)
                 
+                # Add customer j to route
                 route.nodes.append(j)
-                route.current_battery -= energy_consumed
-                route.current_load += j.demand
-                route.current_time += travel_time + j.service_time
                 visited_customers.add(j)
                 i = j.id  # set current position to j
                 
                 # Step 4: if (it is possible to reach any depot directly from j) then
-                if self._can_reach_any_depot_directly(i, route.current_battery, 
-                                          route.current_load, route.current_time) is not None:
+                if recharge_option is None:
                     # Continue to next iteration to potentially add more customers
                     continue
-                else:
-                    # Step 7: if (it is possible to reach any depot from j by visiting a recharge node r in between) then
-                    recharge_option = self._find_best_recharge_station_to_any_depot(i, route.current_battery, 
-                                                                               route.current_load, route.current_time)
-                    if recharge_option is not None:
-                        station, tech, energy_to_recharge, target_depot_id = recharge_option
-                        
-                        # Add station to route
-                        route.nodes.append(station)
-                        
-                        # Move to recharge station
-                        dist_to_station = self.instance.distance_matrix[i][station.id]
-                        energy_to_station = dist_to_station * self.instance.vehicle.consumption_rate
-                        time_to_station = self.instance.time_matrix[i][station.id]
-                        
-                        route.current_battery -= energy_to_station
-                        route.current_time += time_to_station
-                        
-                        # Perform recharge
-                        recharge_time = energy_to_recharge / tech.power
-                        route.current_battery += energy_to_recharge
-                        route.current_time += self.instance.charging_fixed_time + recharge_time
-                        route.charging_decisions[station.id] = (tech, energy_to_recharge)
-                        
-                        i = station.id  # set i := station
-                        continue  # Go back to step 2 (repeat)
-                    else:
-                        break
+                
+                # Step 7: otherwise the scan found a recharge node r that leads to a depot
+                station, tech, energy_to_recharge, target_depot_id = recharge_option
+                
+                # Add station to route
+                route.nodes.append(station)
+                
+                # Move to recharge station
+                energy_to_station = energy_matrix[i, station.id]
+                time_to_station = time_matrix[i, station.id]
+                
+                route.current_battery -= energy_to_station
+                route.current_time += time_to_station
+                
+                # Perform recharge
+                recharge_time = energy_to_recharge / tech.power
+                route.current_battery += energy_to_recharge
+                route.current_time += charging_fixed_time + recharge_time
+                route.charging_decisions[station.id] = (tech, energy_to_recharge)
+                
+                i = station.id  # set i := station
+                # Go back to step 2 (repeat)
             
             # Close route at nearest reachable depot (directly or after recharge already handled in loop)
             best_depot_id = self._can_reach_any_depot_directly(i, route.current_battery, route.current_load, route.current_time)
             if best_depot_id is None:
                 # As a fallback, choose the closest depot ignoring constraints and let evaluation mark infeasible
-                best_depot_id = min(self.depots.keys(), key=lambda d: self.instance.distance_matrix[i][d])
+                best_depot_id = min(self.depots.keys(), key=lambda d: distance_matrix[i, d])
             end_depot = self.depots[best_depot_id]
             route.nodes.append(end_depot)
             
             # Update final time and battery to depot
             if i != end_depot.id:  # if not already at depot
-                final_distance = self.instance.distance_matrix[i][end_depot.id]
-                final_energy = final_distance * self.instance.vehicle.consumption_rate
-                final_time = self.instance.time_matrix[i][end_depot.id]
+                final_energy = energy_matrix[i, end_depot.id]
+                final_time = time_matrix[i, end_depot.id]
                 
                 route.current_battery -= final_energy
                 route.current_time += final_time
@@ -394,8 +453,8 @@ class ConstructiveHeuristic:
             h += 1  # increment route number
             
             # Safety check - if we can't serve remaining customers with current vehicle fleet
-            if len(solution.routes) >= self.instance.num_vehicles and len(visited_customers) < len(self.customers):
-                print(f"Warning: Cannot serve all customers with {self.instance.num_vehicles} vehicles")
+            if len(solution.routes) >= instance.num_vehicles and len(visited_customers) < num_customers:
+                print(f"Warning: Cannot serve all customers with {instance.num_vehicles} vehicles")
                 break
         
         solution.evaluate()
@@ -1,5 +1,7 @@
 
 from math import floor
+import numpy as np
+from numpy.typing import DTypeLike
 from EVRP.classes.customer import Customer
 from EVRP.classes.depot import Depot
 from EVRP.classes.instance import Instance
@@ -9,12 +11,13 @@ from EVRP.classes.vehicle import Vehicle
 from utils.math import build_matrices
 from utils.read_file import read_gvrp_file
 
-def create_evrp_instance(filename: str) -> Instance:
+def create_evrp_instance(filename: str, dtype: DTypeLike = np.float64) -> Instance:
     """
     Cria uma instância do problema EVRP a partir de um dicionário de dados lido com `read_gvrp_file`.
 
     Args:
         filename (str): Caminho para o arquivo de EVRP
+        dtype: Tipo das matrizes de distância e tempo (np.float32 reduz a memória pela metade em instâncias grandes)
 
     Returns:
         Instance: Objeto da instância do problema pronto para uso
@@ -41,10 +44,9 @@ def create_evrp_instance(filename: str) -> Instance:
         all_points.append((data["depot"]["x"], data["depot"]["y"]))
 
     if all_points:
-        min_x = min(p[0] for p in all_points)
-        max_x = max(p[0] for p in all_points)
-        min_y = min(p[1] for p in all_points)
-        max_y = max(p[1] for p in all_points)
+        points = np.array(all_points, dtype=float)
+        min_x, min_y = points.min(axis=0).tolist()
+        max_x, max_y = points.max(axis=0).tolist()
         center_x = (min_x + max_x) / 2.0
         center_y = (min_y + max_y) / 2.0
 
@@ -119,6 +121,6 @@ def create_evrp_instance(filename: str) -> Instance:
     instance.charging_fixed_time = vehicle_params.get("refueling_rate", 3.39)  # horas
     instance.battery_depreciation_cost = 2.27  # €/ciclo
 
-    instance.distance_matrix, instance.time_matrix = build_matrices(instance.nodes, vehicle_params.get("velocity", 1.0))
+    instance.distance_matrix, instance.time_matrix = build_matrices(instance.nodes, vehicle_params.get("velocity", 1.0), dtype)
 
     return instance
@@ -0,0 +1,42 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _two_opt_deltas_loop(ids: np.ndarray, D: np.ndarray) -> np.ndarray:
+    """
+    Laço explícito sobre os pares (i, j); só é usado compilado pelo Numba.
+    """
+    n = ids.shape[0]
+    delta = np.full((n - 3, n - 2), np.inf)
+    for i in range(1, n - 2):
+        a = ids[i - 1]
+        b = ids[i]
+        for j in range(i + 2, n - 1):
+            c = ids[j]
+            d = ids[j + 1]
+            delta[i - 1, j - 1] = D[a, c] + D[b, d] - D[a, b] - D[c, d]
+    return delta
+
+
+def _two_opt_deltas_numpy(ids: np.ndarray, D: np.ndarray) -> np.ndarray:
+    n = ids.shape[0]
+    I = np.arange(1, n - 2)[:, None]
+    J = np.arange(1, n - 1)[None, :]
+    # Troca as arestas (i-1, i) e (j, j+1) por (i-1, j) e (i, j+1)
+    delta = (D[ids[I - 1], ids[J]] + D[ids[I], ids[J + 1]]
+             - D[ids[I - 1], ids[I]] - D[ids[J], ids[J + 1]])
+    delta[J < I + 2] = np.inf
+    return delta
+
+
+# Delta de distância da reversão de nodes[i..j] para cada par válido, em uma
+# matriz (n-3, n-2) indexada por [i-1, j-1]; pares com j - i < 2 valem +inf.
+# Compilado com Numba quando disponível, senão vetorizado com NumPy.
+if njit is not None:
+    two_opt_deltas = njit(cache=True)(_two_opt_deltas_loop)
+else:
+    two_opt_deltas = _two_opt_deltas_numpy
@@ -1,5 +1,5 @@
-import copy
 import random
+from itertools import product
 from typing import List, TYPE_CHECKING
 from EVRP.classes.instance import Instance
 from EVRP.classes.node import NodeType
@@ -15,16 +15,31 @@ class DepotReassignment:
     which can lead to different route structures and potentially better solutions.
     """
     
-    def __init__(self, instance: Instance, k: int = 2):
+    # perturbation() works on a clone and leaves its argument untouched, so
+    # GVNS does not need a backup to undo an infeasible result
+    perturbs_in_place = False
+
+    def __init__(self, instance: Instance, k: int = 2, max_attempts: int = 20):
         """
         Initialize the depot reassignment operator.
         
         Args:
             instance: The EVRP instance
             k: Number of random routes to reassign to different depots
+            max_attempts: Maximum number of (start, end) depot pairs evaluated per route
         """
         self.instance = instance
         self.k = k
+        self.max_attempts = max_attempts
+        # Depots other than each depot, in instance order (shuffled copies are used per route)
+        self._all_depots = tuple(instance.depots)
+        self._other_depots = {
+            depot.id: tuple(other for other in instance.depots if other.id != depot.id)
+            for depot in instance.depots
+        }
+        # Full charge with the first technology, written for every new depot
+        self._full_battery = instance.vehicle.battery_capacity
+        self._depot_charge = (instance.technologies[0], self._full_battery)
 
     def local_search(self, solution: 'Solution') -> bool:
         """
@@ -53,8 +68,8 @@ class DepotReassignment:
         if not solution.routes or len(solution.routes) < 2:
             return solution
             
-        # Create a deep copy of the solution
-        perturbed_solution = copy.deepcopy(solution)
+        # Copy the solution; nodes, technologies and the instance are shared
+        perturbed_solution = solution.clone()
         
         # Select k random routes to reassign (without replacement)
         routes_to_reassign = random.sample(
@@ -87,17 +102,13 @@ class DepotReassignment:
         
         # Store original state for restoration
         original_charging = route.charging_decisions.copy()
+        original_evaluation = (
+            route.total_distance, route.total_cost, route.total_time, route.is_feasible
+        )
         
         # Find available depots (different from current ones)
-        available_start_depots = [
-            depot for depot in self.instance.depots
-            if depot.id != original_start.id
-        ]
-
-        available_end_depots = [
-            depot for depot in self.instance.depots
-            if depot.id != original_end.id
-        ]
+        available_start_depots = list(self._other_depots.get(original_start.id, self._all_depots))
+        available_end_depots = list(self._other_depots.get(original_end.id, self._all_depots))
 
         if not available_start_depots or not available_end_depots:
             return
@@ -105,42 +116,65 @@ class DepotReassignment:
         random.shuffle(available_start_depots)
         random.shuffle(available_end_depots)
 
-        # Try different depot combinations
-        for new_start in available_start_depots:
-            for new_end in available_end_depots:
-                # Update depot nodes
-                route.nodes[0] = new_start
-                route.nodes[-1] = new_end
-
-                # Update charging decisions
-                route.charging_decisions = original_charging.copy()
-                
-                # Remove charging decisions for original depots
-                if original_start.id in route.charging_decisions:
-                    del route.charging_decisions[original_start.id]
-                if original_end.id in route.charging_decisions:
-                    del route.charging_decisions[original_end.id]
-                
-                # Add charging decisions for new depots
-                route.charging_decisions[new_start.id] = (
-                    self.instance.technologies[0],
-                    self.instance.vehicle.battery_capacity
-                )
-                route.charging_decisions[new_end.id] = (
-                    self.instance.technologies[0],
-                    self.instance.vehicle.battery_capacity
-                )
-
-                # Evaluate feasibility
-                route.evaluate(self.instance)
-                if route.is_feasible:
-                    return  # Success - keep the changes
+        # The battery never holds more than its capacity, so a depot whose leg
+        # to/from the route's customers needs more energy than that can never
+        # pass evaluate; drop it before trying the pairs
+        if len(route.nodes) > 2:
+            energy_at = self.instance.get_energy_matrix().item
+            battery_capacity = self._full_battery
+            first_id = route.nodes[1].id
+            last_id = route.nodes[-2].id
+            available_start_depots = [
+                depot for depot in available_start_depots
+                if energy_at(depot.id, first_id) <= battery_capacity
+            ]
+            available_end_depots = [
+                depot for depot in available_end_depots
+                if energy_at(last_id, depot.id) <= battery_capacity
+            ]
+
+        # Charging decisions without the original depots; each pair writes its
+        # depot charges into this dict and reverts them if it fails
+        charging = original_charging.copy()
+        charging.pop(original_start.id, None)
+        charging.pop(original_end.id, None)
+        route.charging_decisions = charging
+        depot_charge = self._depot_charge
+
+        # Try different depot combinations; past max_attempts, a uniform sample of them
+        depot_pairs = list(product(available_start_depots, available_end_depots))
+        if len(depot_pairs) > self.max_attempts:
+            depot_pairs = random.sample(depot_pairs, self.max_attempts)
+        for new_start, new_end in depot_pairs:
+            # Update depot nodes
+            route.nodes[0] = new_start
+            route.nodes[-1] = new_end
+
+            # Update charging decisions with full charges at the new depots
+            saved_start = charging.get(new_start.id)
+            saved_end = charging.get(new_end.id)
+            charging[new_start.id] = depot_charge
+            charging[new_end.id] = depot_charge
+
+            # Evaluate feasibility
+            route.evaluate(self.instance)
+            if route.is_feasible:
+                return  # Success - keep the changes
+
+            # Revert the depot charges before the next pair
+            for depot_id, saved in ((new_end.id, saved_end), (new_start.id, saved_start)):
+                if saved is None:
+                    charging.pop(depot_id, None)
+                else:
+                    charging[depot_id] = saved
 
         # If no feasible reassignment found, restore original state
         route.nodes[0] = original_start
         route.nodes[-1] = original_end
         route.charging_decisions = original_charging
-        route.evaluate(self.instance)
+        # Same nodes and charges as before the trials, so no need to evaluate again
+        (route.total_distance, route.total_cost,
+         route.total_time, route.is_feasible) = original_evaluation
 
 
     def _get_route_depot(self, route: Route):
@@ -187,35 +221,3 @@ class DepotReassignment:
             return False
             
         return True
-
-    def _calculate_depot_distance_impact(self, route: Route, new_depot) -> float:
-        """
-        Calculate the distance impact of reassigning a route to a new depot.
-        
-        Args:
-            route: The route to analyze
-            new_depot: The new depot to assign
-            
-        Returns:
-            float: The distance difference (positive means increase)
-        """
-        if not route.nodes or len(route.nodes) < 3:
-            return 0.0
-            
-        current_depot = route.nodes[0]
-        
-        # Calculate current total distance
-        current_distance = 0.0
-        prev_node = current_depot
-        for node in route.nodes[1:]:
-            current_distance += self.instance.distance_matrix[prev_node.id][node.id]
-            prev_node = node
-        
-        # Calculate new total distance with new depot
-        new_distance = 0.0
-        prev_node = new_depot
-        for node in route.nodes[1:]:
-            new_distance += self.instance.distance_matrix[prev_node.id][node.id]
-            prev_node = node
-        
-        return new_distance - current_distance
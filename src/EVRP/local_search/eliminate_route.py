@@ -159,12 +159,12 @@ class EliminateRoute:
         """
         try:
             # Select the nearest depot as start and end
-            depots = [node for node in self.instance.nodes if node.type == NodeType.DEPOT]
+            depots = self.instance.depots
             if not depots:
                 return None
             
             # Find the nearest depot to the customer
-            depot = min(depots, key=lambda d: self.instance.distance_matrix[customer.id][d.id])
+            depot = min(depots, key=lambda d: self.instance.distance_matrix[customer.id, d.id])
             
             # Create new route
             new_route = Route()
@@ -200,8 +200,8 @@ class EliminateRoute:
                 customer = route.nodes[1]
                 
                 # Calculate energy consumption from depot to customer and back
-                energy_to_customer = self.instance.distance_matrix[depot.id][customer.id] * self.instance.vehicle.consumption_rate
-                energy_from_customer = self.instance.distance_matrix[customer.id][depot.id] * self.instance.vehicle.consumption_rate
+                energy_to_customer = self.instance.distance_matrix[depot.id, customer.id] * self.instance.vehicle.consumption_rate
+                energy_from_customer = self.instance.distance_matrix[customer.id, depot.id] * self.instance.vehicle.consumption_rate
                 total_energy_needed = energy_to_customer + energy_from_customer
                 
                 if total_energy_needed <= self.instance.vehicle.battery_capacity:
@@ -210,12 +210,12 @@ class EliminateRoute:
                     return route if route.is_feasible else None
                 
                 # Try to find a charging station between customer and depot
-                stations = [node for node in self.instance.nodes if node.type == NodeType.STATION]
+                stations = self.instance.stations
                 if not stations:
                     return None
                 
                 # Find closest station to customer
-                closest_station = min(stations, key=lambda s: self.instance.distance_matrix[customer.id][s.id])
+                closest_station = min(stations, key=lambda s: self.instance.distance_matrix[customer.id, s.id])
                 
                 # Create route: depot -> customer -> station -> depot
                 new_route = Route()
@@ -226,7 +226,7 @@ class EliminateRoute:
                 if closest_station.technologies:
                     tech = random.choice(closest_station.technologies)
                     # Calculate energy needed to reach depot
-                    energy_needed = self.instance.distance_matrix[closest_station.id][depot.id] * self.instance.vehicle.consumption_rate
+                    energy_needed = self.instance.distance_matrix[closest_station.id, depot.id] * self.instance.vehicle.consumption_rate
                     new_route.charging_decisions[closest_station.id] = (tech, energy_needed)
                 
                 new_route.evaluate(self.instance)
@@ -1,4 +1,3 @@
-import copy
 import random
 from typing import List, Tuple, TYPE_CHECKING
 from EVRP.classes.instance import Instance
@@ -85,14 +84,14 @@ class Exchange:
         if len(customer_positions) < 2:
             return False
         
-        best_route = copy.deepcopy(route)
+        best_route = route.clone()
         improved = False
         
         for i in range(len(customer_positions) - 1):
             for j in range(i + 1, len(customer_positions)):
                 pos1, pos2 = customer_positions[i], customer_positions[j]
                 
-                new_route = copy.deepcopy(route)
+                new_route = route.clone()
                 new_route.nodes[pos1], new_route.nodes[pos2] = new_route.nodes[pos2], new_route.nodes[pos1]
                 
                 new_route.evaluate(self.instance)
@@ -125,7 +124,7 @@ class Exchange:
         
         pos1, pos2 = random.sample(customer_positions, 2)
         
-        new_route = copy.deepcopy(route)
+        new_route = route.clone()
         new_route.nodes[pos1], new_route.nodes[pos2] = new_route.nodes[pos2], new_route.nodes[pos1]
         
         new_route.evaluate(self.instance)
@@ -1,4 +1,5 @@
-from typing import List, Tuple, TYPE_CHECKING
+import logging
+from typing import List, NamedTuple, Optional, Tuple, TYPE_CHECKING
 from EVRP.classes.instance import Instance
 from EVRP.classes.node import Node, NodeType
 from EVRP.classes.route import Route
@@ -8,6 +9,15 @@ from EVRP.classes.technology import Technology
 if TYPE_CHECKING:
     from EVRP.solution import Solution
 
+logger = logging.getLogger(__name__)
+
+class RechargeOption(NamedTuple):
+    """A candidate recharge stop: station inserted after customer_sequence[position]."""
+    station: Station
+    position: int
+    technology: Technology
+    energy: float
+
 class RechargeRealocation:
     def __init__(self, instance: Instance):
         self.instance = instance
@@ -23,7 +33,7 @@ class RechargeRealocation:
             solution.evaluate()
             
             if not solution.is_feasible:
-                print("Warning: Recharge relocation made solution infeasible")
+                logger.debug("Recharge relocation made solution infeasible")
         
         return improved
     
@@ -49,10 +59,11 @@ class RechargeRealocation:
             if not stations_to_remove:
                 return False
             
+            # Drop every station in a single pass instead of one linear
+            # list.remove per station
+            route.nodes[:] = [node for node in route.nodes if node.type != NodeType.STATION]
             for original_idx, station_node in stations_to_remove:
-                route.nodes.remove(station_node)
-                if station_node.id in route.charging_decisions:
-                    route.charging_decisions.pop(station_node.id)
+                route.charging_decisions.pop(station_node.id, None)
             
             route.evaluate(self.instance)
             
@@ -100,7 +111,7 @@ class RechargeRealocation:
         for i in range(len(customer_sequence) - 1):
             from_node = customer_sequence[i]
             to_node = customer_sequence[i + 1]
-            total_distance += self.instance.distance_matrix[from_node.id][to_node.id]
+            total_distance += self.instance.distance_matrix[from_node.id, to_node.id]
         return total_distance
     
     def _find_recharge_interval(self, customer_sequence: List[Node], AT: float) -> Tuple[int, int]:
@@ -110,7 +121,7 @@ class RechargeRealocation:
         for start_segment in range(1, h-1):
             cumulative_distance = 0
             for i in range(start_segment, h):
-                cumulative_distance += self.instance.distance_matrix[customer_sequence[i-1].id][customer_sequence[i].id]
+                cumulative_distance += self.instance.distance_matrix[customer_sequence[i-1].id, customer_sequence[i].id]
             
             if cumulative_distance <= AT:
                 a = start_segment
@@ -121,7 +132,7 @@ class RechargeRealocation:
         for start_segment in range(2, h):
             cumulative_distance = 0
             for i in range(1, start_segment):
-                cumulative_distance += self.instance.distance_matrix[customer_sequence[i].id][customer_sequence[i+1].id]
+                cumulative_distance += self.instance.distance_matrix[customer_sequence[i].id, customer_sequence[i+1].id]
             
             if cumulative_distance <= AT:
                 b = start_segment
@@ -131,7 +142,7 @@ class RechargeRealocation:
         
         return a, b
     
-    def _find_best_recharge_option(self, customer_sequence: List[Node], a: int, b: int, route: Route) -> dict:
+    def _find_best_recharge_option(self, customer_sequence: List[Node], a: int, b: int, route: Route) -> Optional[RechargeOption]:
         """
         Find the best recharge station and technology for the given interval.
         
@@ -141,7 +152,7 @@ class RechargeRealocation:
             route: The current route
             
         Returns:
-            dict: Best recharge option with station, position, technology, and energy, or None if not found
+            RechargeOption: Best recharge option with station, position, technology, and energy, or None if not found
         """
         best_option = None
         best_cost = float('inf')
@@ -154,22 +165,17 @@ class RechargeRealocation:
                 if not self._is_station_reachable(customer_sequence, i, station):
                     continue
                 
+                # The energy needed does not depend on the technology
+                min_energy = self._calculate_min_energy_needed(customer_sequence, i, station)
+                if min_energy is None:
+                    continue
+                
                 for tech in station.technologies:
-                    min_energy = self._calculate_min_energy_needed(customer_sequence, i, station)
-                    
-                    if min_energy is None:
-                        continue
-                    
                     option_cost = min_energy * tech.cost_per_kwh
                     
                     if option_cost < best_cost:
                         if self._verify_time_constraint(customer_sequence, i, station, tech, min_energy):
-                            best_option = {
-                                'station': station,
-                                'position': i,
-                                'technology': tech,
-                                'energy': min_energy
-                            }
+                            best_option = RechargeOption(station, i, tech, min_energy)
                             best_cost = option_cost
         
         return best_option
@@ -182,10 +188,10 @@ class RechargeRealocation:
         current_node = customer_sequence[position]
         next_node = customer_sequence[position + 1]
         
-        dist_to_station = self.instance.distance_matrix[current_node.id][station.id]
-        dist_from_station = self.instance.distance_matrix[station.id][next_node.id]
+        dist_to_station = self.instance.distance_matrix[current_node.id, station.id]
+        dist_from_station = self.instance.distance_matrix[station.id, next_node.id]
         
-        direct_distance = self.instance.distance_matrix[current_node.id][next_node.id]
+        direct_distance = self.instance.distance_matrix[current_node.id, next_node.id]
         detour_distance = dist_to_station + dist_from_station
         
         return detour_distance <= direct_distance * 1.5
@@ -202,13 +208,13 @@ class RechargeRealocation:
         Returns:
             float: Minimum energy needed, or None if not feasible
         """
+        energy_matrix = self.instance.get_energy_matrix()
         energy_consumed = 0
         current_node = station
         
         for i in range(position + 1, len(customer_sequence)):
             next_node = customer_sequence[i]
-            distance = self.instance.distance_matrix[current_node.id][next_node.id]
-            energy_consumed += distance * self.instance.vehicle.consumption_rate
+            energy_consumed += energy_matrix[current_node.id, next_node.id]
             current_node = next_node
         
         # Check if this energy consumption is within battery capacity
@@ -222,8 +228,7 @@ class RechargeRealocation:
         
         for i in range(1, position + 1):
             next_node = customer_sequence[i]
-            distance = self.instance.distance_matrix[current_node.id][next_node.id]
-            energy_to_station += distance * self.instance.vehicle.consumption_rate
+            energy_to_station += energy_matrix[current_node.id, next_node.id]
             current_node = next_node
         
         # Check if we can reach the station
@@ -252,9 +257,9 @@ class RechargeRealocation:
         next_node = customer_sequence[position + 1]
         
         # Time for detour
-        direct_time = self.instance.time_matrix[current_node.id][next_node.id]
-        detour_time = (self.instance.time_matrix[current_node.id][station.id] + 
-                      self.instance.time_matrix[station.id][next_node.id])
+        direct_time = self.instance.time_matrix[current_node.id, next_node.id]
+        detour_time = (self.instance.time_matrix[current_node.id, station.id] + 
+                      self.instance.time_matrix[station.id, next_node.id])
         
         # Additional travel time
         additional_travel_time = detour_time - direct_time
@@ -279,7 +284,7 @@ class RechargeRealocation:
             to_node = customer_sequence[i + 1]
             
             # Travel time
-            total_time += self.instance.time_matrix[from_node.id][to_node.id]
+            total_time += self.instance.time_matrix[from_node.id, to_node.id]
             
             # Service time for customers
             if to_node.type == NodeType.CUSTOMER:
@@ -288,7 +293,7 @@ class RechargeRealocation:
         return total_time
     
     def _apply_recharge_optimization(self, route: Route, customer_sequence: List[Node], 
-                                   recharge_option: dict) -> None:
+                                   recharge_option: RechargeOption) -> None:
         """
         Apply the recharge optimization to the route.
         
@@ -297,10 +302,7 @@ class RechargeRealocation:
             customer_sequence: Sequence of customers (including depot)
             recharge_option: The best recharge option found
         """
-        station = recharge_option['station']
-        position = recharge_option['position']
-        technology = recharge_option['technology']
-        energy = recharge_option['energy']
+        station, position, technology, energy = recharge_option
         
         # Find the actual position in the route nodes
         route_position = self._find_route_position(route, customer_sequence[position])
@@ -328,7 +330,7 @@ class RechargeRealocation:
         return -1
     
     def _revert_recharge_optimization(self, route: Route, customer_sequence: List[Node], 
-                                    recharge_option: dict) -> None:
+                                    recharge_option: RechargeOption) -> None:
         """
         Revert the recharge optimization if it made the route infeasible.
         
@@ -337,8 +339,8 @@ class RechargeRealocation:
             customer_sequence: Sequence of customers (including depot)
             recharge_option: The recharge option that was applied
         """
-        station = recharge_option['station']
-        position = recharge_option['position']
+        station = recharge_option.station
+        position = recharge_option.position
         
         # Find and remove the inserted recharge station
         route_position = self._find_route_position(route, customer_sequence[position])
@@ -1,4 +1,3 @@
-import copy
 import random
 from typing import List, Tuple, TYPE_CHECKING
 from EVRP.classes.instance import Instance
@@ -82,7 +81,7 @@ class Relocate:
         if len(customer_positions) < 2:
             return False
         
-        best_route = copy.deepcopy(route)
+        best_route = route.clone()
         
         for customer_pos in customer_positions:
             for new_pos in range(1, len(route.nodes) - 1):
@@ -155,8 +154,8 @@ class Relocate:
         if len(source_customers) == 0:
             return False
         
-        best_source = copy.deepcopy(source_route)
-        best_target = copy.deepcopy(target_route)
+        best_source = source_route.clone()
+        best_target = target_route.clone()
         
         for customer_pos in source_customers:
             for target_pos in range(1, len(target_route.nodes) - 1):
@@ -82,7 +82,7 @@ class RouteSplit:
             return True
             
         # Split if route duration is close to maximum
-        if hasattr(route, 'total_time') and route.total_time > self.instance.max_route_duration * 0.8:
+        if route.total_time > self.instance.max_route_duration * 0.8:
             return True
             
         # Split if route distance is very high (heuristic)
@@ -145,9 +145,7 @@ class RouteSplit:
         if self._is_better_split(route_to_split, new_routes):
             # Replace the original route with the two new routes
             route_index = solution.routes.index(route_to_split)
-            solution.routes.remove(route_to_split)
-            solution.routes.insert(route_index, new_routes[0])
-            solution.routes.insert(route_index + 1, new_routes[1])
+            solution.routes[route_index:route_index + 1] = new_routes
             return True
         
         return False
@@ -189,9 +187,7 @@ class RouteSplit:
         if new_routes[0].is_feasible and new_routes[1].is_feasible:
             # Replace the original route with the two new routes
             route_index = solution.routes.index(route_to_split)
-            solution.routes.remove(route_to_split)
-            solution.routes.insert(route_index, new_routes[0])
-            solution.routes.insert(route_index + 1, new_routes[1])
+            solution.routes[route_index:route_index + 1] = new_routes
             return True
         
         return False
@@ -360,11 +356,8 @@ class RouteSplit:
         
         # Also consider if the split improves route balance
         # (reduces the maximum route duration)
-        if hasattr(route1, 'total_time') and hasattr(route2, 'total_time'):
-            max_new_time = max(route1.total_time, route2.total_time)
-            if hasattr(original_route, 'total_time'):
-                original_time = original_route.total_time
-                if max_new_time < original_time * 0.9:  # 10% improvement threshold
-                    return True
+        max_new_time = max(route1.total_time, route2.total_time)
+        if max_new_time < original_route.total_time * 0.9:  # 10% improvement threshold
+            return True
         
         return False
@@ -1,9 +1,10 @@
-import copy
 import random
+import numpy as np
 from typing import List, Tuple, TYPE_CHECKING
 from EVRP.classes.instance import Instance
 from EVRP.classes.node import Node, NodeType
 from EVRP.classes.route import Route
+from EVRP.local_search._numba_kernels import two_opt_deltas
 
 if TYPE_CHECKING:
     from EVRP.solution import Solution
@@ -21,7 +22,7 @@ class TwoOpt:
         """
         improved = False
         for _ in range(self.max_iter):
-            route_idx = random.randint(0, len(solution.routes) - 1)
+            route_idx = random.randrange(len(solution.routes))
             route = solution.routes[route_idx]
             if self.two_opt(route):
                 improved = True
@@ -34,7 +35,7 @@ class TwoOpt:
         Returns True if any improvement was made, False otherwise.
         """
         for _ in range(self.max_iter):
-            route_idx = random.randint(0, len(solution.routes) - 1)
+            route_idx = random.randrange(len(solution.routes))
             route = solution.routes[route_idx]
             self.two_opt_random(route)
         
@@ -44,34 +45,44 @@ class TwoOpt:
         """
         Apply 2-opt intra-route optimization to a single route.
         Returns True if any improvement was made, False otherwise.
+
+        The distance delta of every (i, j) reversal is computed at once from the
+        distance matrix; candidates are then tried from the most negative delta
+        (best improvement) until one is feasible. Reversing a segment does not
+        change the charging cost, so only moves that shorten the route can
+        dominate it.
         """
         if len(route.nodes) <= 3:  # Need at least depot + 2 nodes + depot
             return False
-            
-        best_route = copy.deepcopy(route)
-        current_route = copy.deepcopy(route)
 
-        for i in range(1, len(current_route.nodes) - 2):
-            for j in range(i + 1, len(current_route.nodes) - 1):
-                if j - i == 1:
-                    continue
-                
-                new_route = copy.deepcopy(current_route)
-                new_route.nodes = (current_route.nodes[:i] + 
-                                    current_route.nodes[i:j+1][::-1] + 
-                                    current_route.nodes[j+1:])
-                
-                new_route.evaluate(self.instance)
-                
-                if new_route.is_feasible and self._is_better_route(new_route, best_route):
-                    best_route = new_route
-                    current_route = new_route
-                    route.nodes = best_route.nodes
-                    route.charging_decisions = best_route.charging_decisions
-                    route.evaluate(self.instance)
-                    return True
+        for i, j in self._candidate_moves(route):
+            new_route = route.clone()
+            new_route.nodes[i:j+1] = route.nodes[i:j+1][::-1]
+            
+            new_route.evaluate(self.instance)
+            
+            if new_route.is_feasible and self._is_better_route(new_route, route):
+                self._apply_move(route, new_route)
+                return True
         
         return False
+
+    def _candidate_moves(self, route: Route) -> List[Tuple[int, int]]:
+        """
+        Pairs (i, j) whose reversal of route.nodes[i..j] (j - i >= 2) should be
+        tried, in increasing order of distance delta. Without select_best, all
+        pairs in scan order.
+        """
+        n = len(route.nodes)
+        if not self.select_best:
+            return [(i, j) for i in range(1, n - 2) for j in range(i + 2, n - 1)]
+
+        ids = route.node_ids()
+        delta = two_opt_deltas(ids, self.instance.distance_matrix)
+        
+        rows, cols = np.nonzero(delta < 0)
+        order = np.argsort(delta[rows, cols], kind='stable')
+        return list(zip((rows[order] + 1).tolist(), (cols[order] + 1).tolist()))
     
     def two_opt_random(self, route: Route) -> bool:
         """
@@ -81,24 +92,32 @@ class TwoOpt:
         if len(route.nodes) <= 3:
             return False
             
-        i = random.randint(1, len(route.nodes) - 3)
-        j = random.randint(i + 1, len(route.nodes) - 2)
+        # randrange(a, b + 1) is what randint(a, b) calls: same random sequence
+        n = len(route.nodes)
+        i = random.randrange(1, n - 2)
+        j = random.randrange(i + 1, n - 1)
 
-        new_route = copy.deepcopy(route)
-        new_route.nodes = (
-            route.nodes[:i] + 
-            route.nodes[i:j+1][::-1] + 
-            route.nodes[j+1:]
-        )
+        new_route = route.clone()
+        new_route.nodes[i:j+1] = route.nodes[i:j+1][::-1]
         new_route.evaluate(self.instance)
         if new_route.is_feasible and self._is_better_route(new_route, route):
-            route.nodes = new_route.nodes
-            route.charging_decisions = new_route.charging_decisions
-            route.evaluate(self.instance)
+            self._apply_move(route, new_route)
             return True
 
         return False
     
+    def _apply_move(self, route: Route, new_route: Route):
+        """
+        Copy the accepted move into route. new_route has just been evaluated,
+        so its totals are reused instead of evaluating route a second time.
+        """
+        route.nodes = new_route.nodes
+        route.charging_decisions = new_route.charging_decisions
+        route.total_distance = new_route.total_distance
+        route.total_cost = new_route.total_cost
+        route.total_time = new_route.total_time
+        route.is_feasible = new_route.is_feasible
+    
     def _is_better_route(self, route1: Route, route2: Route) -> bool:
         """
         Check if route1 is better than route2.
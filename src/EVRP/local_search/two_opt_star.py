@@ -1,4 +1,3 @@
-import copy
 import random
 from typing import List, Tuple, TYPE_CHECKING
 from EVRP.classes.instance import Instance
@@ -64,8 +63,8 @@ class TwoOptStar:
         if len(route1.nodes) <= 2 or len(route2.nodes) <= 2:
             return False
             
-        best_route1 = copy.deepcopy(route1)
-        best_route2 = copy.deepcopy(route2)
+        best_route1 = route1.clone()
+        best_route2 = route2.clone()
         
         valid_indices_r1 = list(range(1, len(route1.nodes) - 1))
         valid_indices_r2 = list(range(1, len(route2.nodes) - 1))
@@ -114,8 +113,8 @@ class TwoOptStar:
         if len(route1.nodes) <= 2 or len(route2.nodes) <= 2:  # Need at least depot + 1 node + depot
             return False
             
-        best_route1 = copy.deepcopy(route1)
-        best_route2 = copy.deepcopy(route2)
+        best_route1 = route1.clone()
+        best_route2 = route2.clone()
         
         for i in range(1, len(route1.nodes) - 1):
             for j in range(1, len(route2.nodes) - 1):
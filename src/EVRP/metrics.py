@@ -4,9 +4,7 @@ Adapts the general ParetoMetrics class for Electric Vehicle Routing Problem solu
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import List, Tuple, Optional, Dict
-from scipy.spatial.distance import euclidean
+from typing import List, Tuple, Optional, Dict, TYPE_CHECKING
 import sys
 import os
 
@@ -17,6 +15,9 @@ from metrics import ParetoMetrics
 from EVRP.solution import Solution
 from EVRP.classes.instance import Instance
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 
 class EVRPMetrics(ParetoMetrics):
     """
@@ -139,36 +140,53 @@ class EVRPMetrics(ParetoMetrics):
         # Filter feasible solutions
         feasible_solutions = [sol for sol in solutions if sol.is_feasible]
         
-        if len(feasible_solutions) < 2:
+        # Convert to Pareto front
+        pareto_front = self.solutions_to_pareto_front(feasible_solutions)
+        
+        return self.evaluate_objectives(pareto_front, num_solutions=len(solutions))
+    
+    def evaluate_objectives(self, pareto_front: np.ndarray,
+                            num_solutions: Optional[int] = None) -> Dict[str, float]:
+        """
+        Evaluate a set of feasible objective vectors using Pareto quality metrics.
+        
+        Args:
+            pareto_front: Array of shape (n_solutions, 2) with [distance, cost]
+            num_solutions: Total number of solutions, including infeasible ones
+            
+        Returns:
+            Dict containing metric values
+        """
+        num_feasible = len(pareto_front)
+        if num_solutions is None:
+            num_solutions = num_feasible
+        
+        if num_feasible < 2:
             return {
                 'spread_measure': 0.0,
                 'hypervolume': 0.0,
-                'num_solutions': len(solutions),
-                'num_feasible': len(feasible_solutions)
+                'num_solutions': num_solutions,
+                'num_feasible': num_feasible
             }
         
-        # Convert to Pareto front
-        pareto_front = self.solutions_to_pareto_front(feasible_solutions)
-        
         # Calculate reference points
-        utopian = self.calculate_utopian_point(feasible_solutions)
-        nadir = self.calculate_nadir_point(feasible_solutions)
+        utopian = np.min(pareto_front, axis=0)
+        nadir = np.max(pareto_front, axis=0)
         
         # Ensure nadir is strictly greater than utopian
         nadir = np.maximum(nadir, utopian * 1.1)
         
-        # Calculate metrics
-        spread = self.spread_measure(pareto_front, utopian, nadir)
-        
         # For hypervolume, use nadir as reference point
         reference_point = nadir * 1.1  # Slightly worse than nadir
-        hv = self.hypervolume(pareto_front, reference_point)
+        
+        # Calculate metrics
+        spread, hv = self.compute_both(pareto_front, reference_point, utopian, nadir)
         
         return {
             'spread_measure': spread,
             'hypervolume': hv,
-            'num_solutions': len(solutions),
-            'num_feasible': len(feasible_solutions),
+            'num_solutions': num_solutions,
+            'num_feasible': num_feasible,
             'utopian_point': utopian,
             'nadir_point': nadir,
             'reference_point': reference_point
@@ -177,10 +195,11 @@ class EVRPMetrics(ParetoMetrics):
     def plot_evrp_pareto_front(self, solutions: List[Solution], 
                               title: str = "Fronteira Pareto",
                               show_metrics: bool = True,
-                              show_reference_points: bool = True) -> plt.Figure:
+                              show_reference_points: bool = True) -> "plt.Figure":
         """
         Plot EVRP Pareto front in 2D projections with nadir and utopic points.
         """
+        import matplotlib.pyplot as plt
         feasible_solutions = [sol for sol in solutions if sol.is_feasible]
         
         if len(feasible_solutions) < 2:
@@ -245,13 +264,14 @@ class EVRPMetrics(ParetoMetrics):
         return fig
 
     
-    def track_convergence(self, archive_history: List[List[Solution]], 
+    def track_convergence(self, archive_history: List[np.ndarray], 
                          iterations: List[int]) -> Dict[str, List[float]]:
         """
         Track convergence of metrics over iterations.
         
         Args:
-            archive_history: List of solution archives at each iteration
+            archive_history: Objective arrays (n_solutions, 2) of the feasible
+                archive members at each iteration
             iterations: List of iteration numbers
             
         Returns:
@@ -262,8 +282,8 @@ class EVRPMetrics(ParetoMetrics):
         num_solutions = []
         num_feasible = []
         
-        for archive in archive_history:
-            metrics = self.evaluate_solution_set(archive)
+        for objectives in archive_history:
+            metrics = self.evaluate_objectives(objectives)
             spread_values.append(metrics['spread_measure'])
             hv_values.append(metrics['hypervolume'])
             num_solutions.append(metrics['num_solutions'])
@@ -278,7 +298,7 @@ class EVRPMetrics(ParetoMetrics):
         }
     
     def plot_convergence_evrp(self, convergence_data: Dict[str, List[float]], 
-                             title: str = "EVRP Metrics Convergence") -> plt.Figure:
+                             title: str = "EVRP Metrics Convergence") -> "plt.Figure":
         """
         Plot convergence of EVRP metrics.
         
@@ -289,6 +309,7 @@ class EVRPMetrics(ParetoMetrics):
         Returns:
             matplotlib Figure object
         """
+        import matplotlib.pyplot as plt
         fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         fig.suptitle(title, fontsize=16, fontweight='bold')
         
@@ -1,8 +1,11 @@
+import logging
 from typing import List
 from EVRP.classes.instance import Instance
 from EVRP.classes.node import NodeType
 from EVRP.classes.route import Route
 
+logger = logging.getLogger(__name__)
+
 class Solution:
     def __init__(self, instance: Instance):
         self.instance = instance
@@ -11,6 +14,8 @@ class Solution:
         self.total_cost: float = 0
         self.num_vehicles_used: int = 0
         self.is_feasible: bool = True
+        # Tupla de objetivos, atualizada em evaluate() e usada como hash no arquivo
+        self._obj_hash = (self.total_distance, self.total_cost)
         
     def evaluate(self):
         """Evaluate the complete solution"""
@@ -22,27 +27,36 @@ class Solution:
         # Check if we have too many vehicles
         if self.num_vehicles_used > self.instance.num_vehicles:
             self.is_feasible = False
-            print(f"Too many vehicles used: {self.num_vehicles_used} > {self.instance.num_vehicles}")
+            logger.debug("Too many vehicles used: %d > %d", self.num_vehicles_used, self.instance.num_vehicles)
         
-        for _, route in enumerate(self.routes):
+        served_customers = set()
+        for route in self.routes:
             route.evaluate(self.instance)
             self.total_distance += route.total_distance
 
             self.total_cost += route.total_cost
             if not route.is_feasible:
                 self.is_feasible = False
+
+            served_customers.update(node.id for node in route.nodes if node.type == NodeType.CUSTOMER)
         
-        served_customers = set()
-        for route in self.routes:
-            for node in route.nodes:
-                if node.type == NodeType.CUSTOMER:
-                    served_customers.add(node.id)
-        
-        all_customers = {node.id for node in self.instance.nodes if node.type == NodeType.CUSTOMER}
+        all_customers = self.instance.get_customer_ids()
         if served_customers != all_customers:
             self.is_feasible = False
-            unserved = all_customers - served_customers
-            print(f"Unserved customers: {unserved}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Unserved customers: %s", all_customers - served_customers)
+
+        self._obj_hash = (self.total_distance, self.total_cost)
+
+    def clone(self) -> "Solution":
+        """
+        Copia a solução sem passar por copy.deepcopy: a instância é
+        compartilhada e cada rota é clonada com Route.clone
+        """
+        new_sol = Solution.__new__(Solution)
+        new_sol.__dict__.update(self.__dict__)
+        new_sol.routes = [route.clone() for route in self.routes]
+        return new_sol
 
     def dominates(self, new_sol: "Solution") -> bool:
         """
@@ -51,11 +65,11 @@ class Solution:
         # Para o EVRP, consideramos múltiplos objetivos
         # Objetivo 1: Minimizar distância total
         # Objetivo 2: Minimizar custo total
-        # Verifica se sol1 é melhor ou igual em todos os objetivos
-        if (self.total_distance <= new_sol.total_distance and
-            self.total_cost <= new_sol.total_cost):
-            # Verifica se sol1 é melhor em pelo menos um objetivo
-            if (self.total_distance < new_sol.total_distance or
-                self.total_cost < new_sol.total_cost):
-                return True
-        return False
+        # Falha rápido: qualquer objetivo pior já descarta a dominância
+        if self.total_distance > new_sol.total_distance:
+            return False
+        if self.total_cost > new_sol.total_cost:
+            return False
+        # Melhor ou igual em todos: domina se for melhor em pelo menos um
+        return (self.total_distance < new_sol.total_distance or
+                self.total_cost < new_sol.total_cost)
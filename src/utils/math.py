@@ -1,6 +1,7 @@
-# import numpy as np
+import numpy as np
 from EVRP.classes.instance import Matrix
 from EVRP.classes.node import Node
+from numpy.typing import DTypeLike
 from typing import  List, Tuple, TypeAlias
 import math
 
@@ -9,22 +10,21 @@ DistanceTimeMatrices: TypeAlias = Tuple[Matrix, Matrix]
 def euclidean_distance(node1: Node, node2: Node) -> float:
     return math.sqrt((node1.x - node2.x)**2 + (node1.y - node2.y)**2)
 
-def build_matrices(nodes: List[Node], avg_speed: float = 25.0) -> DistanceTimeMatrices:
-    distance_matrix = {}
-    time_matrix = {}
-
-    for node_i in nodes:
-        distance_matrix[node_i.id] = {}
-        time_matrix[node_i.id] = {}
-
-        for node_j in nodes:
-            if node_i.id != node_j.id:
-                dist = math.sqrt((node_i.x - node_j.x) ** 2 + (node_i.y - node_j.y) ** 2)
-                distance_matrix[node_i.id][node_j.id] = dist
-                time_matrix[node_i.id][node_j.id] = dist / avg_speed
-            else:
-                distance_matrix[node_i.id][node_j.id] = 0.0
-                time_matrix[node_i.id][node_j.id] = 0.0
+def build_matrices(nodes: List[Node], avg_speed: float = 25.0, dtype: DTypeLike = np.float64) -> DistanceTimeMatrices:
+    from scipy.spatial.distance import cdist
+
+    # Um nó por id (o último vence, como na construção célula a célula)
+    nodes_by_id = {node.id: node for node in nodes}
+    ids = np.fromiter(nodes_by_id.keys(), dtype=np.intp, count=len(nodes_by_id))
+    coords = np.array([(node.x, node.y) for node in nodes_by_id.values()], dtype=float)
+
+    # As linhas/colunas são os próprios ids; ids sem nó ficam zerados.
+    # Com dtype=np.float32 as matrizes ocupam metade da memória, mas as
+    # distâncias (e os resultados) deixam de ser idênticos aos de float64
+    size = int(ids.max()) + 1 if len(ids) else 0
+    distance_matrix = np.zeros((size, size), dtype=dtype)
+    distance_matrix[np.ix_(ids, ids)] = cdist(coords, coords, 'euclidean')
+    time_matrix = (distance_matrix / avg_speed).astype(dtype, copy=False)
 
     return distance_matrix, time_matrix
 
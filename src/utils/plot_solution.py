@@ -1,6 +1,3 @@
-from matplotlib import pyplot as plt
-from matplotlib.patheffects import withStroke
-
 from EVRP.classes.instance import Instance
 from EVRP.classes.node import NodeType
 from EVRP.solution import Solution
@@ -16,6 +13,9 @@ def plot_solution(instance: Instance, solution: Solution, save_path: str = None)
         solution: Solução a ser plotada
         save_path: Caminho opcional para salvar a figura (se None, usa o padrão)
     """
+    from matplotlib import pyplot as plt
+    from matplotlib.patheffects import withStroke
+
     depots = [n for n in instance.nodes if n.type == NodeType.DEPOT]
     customers = [n for n in instance.nodes if n.type == NodeType.CUSTOMER]
     stations = [n for n in instance.nodes if n.type == NodeType.STATION]
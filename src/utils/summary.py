@@ -1,5 +1,3 @@
-import matplotlib.pyplot as plt
-import matplotlib.patheffects as pe
 from EVRP.classes.instance import Instance
 from EVRP.classes.node import NodeType
 from EVRP.classes.technology import TECH_NAME
@@ -11,6 +9,9 @@ def plot_gvrp_instance(instance: Instance):
     Args:
         instance (Instance): Instância do problema GVRP
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.patheffects as pe
+
     depots = [n for n in instance.nodes if n.type == NodeType.DEPOT]
     customers = [n for n in instance.nodes if n.type == NodeType.CUSTOMER]
     stations = [n for n in instance.nodes if n.type == NodeType.STATION]